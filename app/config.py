@@ -1,3 +1,4 @@
+import os
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -6,6 +7,7 @@ class Settings(BaseSettings):
     # GitHub
     github_username: Optional[str] = None
     github_token: Optional[str] = None
+    github_cache_ttl: int = 300
     
     # Email
     smtp_host: str = "smtp-relay"
@@ -18,9 +20,11 @@ class Settings(BaseSettings):
     # App
     secret_key: str = "your-secret-key-change-this"
     debug: bool = False
+    pdf_prewarm: bool = True
     
     class Config:
-        env_file = ".env"
+        # Test runs (TESTING=1) never read a developer's .env
+        env_file = None if os.environ.get("TESTING") else ".env"
         case_sensitive = False
 
 
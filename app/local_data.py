@@ -1,25 +1,71 @@
-import json
+import threading
+import orjson
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple, TypedDict
 
 DATA_DIR = Path("static/data")
 PROJECTS_FILE = DATA_DIR / "projects.json"
-CONTACTS_FILE = DATA_DIR / "contacts.json"
+CONTACTS_FILE = DATA_DIR / "contacts.jsonl"
+# JSON array written by earlier versions; still read, never written
+LEGACY_CONTACTS_FILE = DATA_DIR / "contacts.json"
 
-def load_projects() -> List[Dict]:
-    """Load local projects from JSON file."""
-    if PROJECTS_FILE.exists():
-        with PROJECTS_FILE.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    return []
+class Project(TypedDict, total=False):
+    """Fixed layout shared by local and GitHub projects."""
+    name: str
+    description: Optional[str]
+    github_url: str
+    demo_url: Optional[str]
+    image_url: str
+    technologies: str
+    stars: int
+    language: Optional[str]
+    updated_at: str
+    source: str
+    _search_blob: str
+
+# (mtime_ns, projects) of the last parse of PROJECTS_FILE
+_projects_cache: Optional[Tuple[int, List[Project]]] = None
+
+# Serializes appends to the contacts file across worker threads
+_contacts_lock = threading.Lock()
+
+def search_blob(project: Project) -> str:
+    """Lowercased name and description used to match search queries."""
+    return f"{project.get('name') or ''} {project.get('description') or ''}".lower()
+
+def load_projects() -> List[Project]:
+    """Load local projects from JSON file, re-parsing only when it changes."""
+    global _projects_cache
+    try:
+        mtime = PROJECTS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    if _projects_cache is not None and _projects_cache[0] == mtime:
+        return _projects_cache[1]
+    projects = orjson.loads(PROJECTS_FILE.read_bytes())
+    for project in projects:
+        project["_search_blob"] = search_blob(project)
+    _projects_cache = (mtime, projects)
+    return projects
 
 def save_contact(name: str, email: str, message: str) -> None:
-    """Persist contact form submissions to a JSON file."""
+    """Append a contact form submission to the JSON Lines contacts file."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    contacts: List[Dict] = []
-    if CONTACTS_FILE.exists():
-        with CONTACTS_FILE.open("r", encoding="utf-8") as f:
-            contacts = json.load(f)
-    contacts.append({"name": name, "email": email, "message": message})
-    with CONTACTS_FILE.open("w", encoding="utf-8") as f:
-        json.dump(contacts, f, ensure_ascii=False, indent=2)
+    line = orjson.dumps({"name": name, "email": email, "message": message}) + b"\n"
+    with _contacts_lock:
+        with CONTACTS_FILE.open("ab") as f:
+            f.write(line)
+
+def load_contacts() -> Iterator[Dict]:
+    """Stream saved contact submissions, legacy JSON array first, then one per line."""
+    try:
+        legacy: List[Dict] = orjson.loads(LEGACY_CONTACTS_FILE.read_bytes())
+    except FileNotFoundError:
+        legacy = []
+    yield from legacy
+    if not CONTACTS_FILE.exists():
+        return
+    with CONTACTS_FILE.open("rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
@@ -1,23 +1,38 @@
+import asyncio
+import re
 from fastapi import FastAPI, Request, Form, HTTPException
-from fastapi.responses import HTMLResponse, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 import httpx
-from typing import Optional
+import jinja2
+from typing import Callable, List, Optional
 
 from .config import settings
 from .services.github import GitHubService
 from .services.email import EmailService
-from .services.pdf import PDFService
-from .local_data import load_projects, save_contact
+from .services.pdf import PDFService, content_etag, supported_language
+from .local_data import Project, load_projects, save_contact, search_blob
 
-app = FastAPI(title="Personal Portfolio", description="Leonardo's Personal Website")
+app = FastAPI(
+    title="Personal Portfolio",
+    description="Leonardo's Personal Website",
+    default_response_class=ORJSONResponse,
+)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-# Jinja2 templates
-templates = Jinja2Templates(directory="templates")
+# Jinja2 templates (unbounded compiled-template cache, no mtime checks outside debug)
+template_env = jinja2.Environment(
+    loader=jinja2.FileSystemLoader("templates"),
+    autoescape=True,
+    auto_reload=settings.debug,
+    cache_size=-1,
+    # Separate file pattern from the PDF environment, which compiles without autoescape
+    bytecode_cache=jinja2.FileSystemBytecodeCache(pattern="__jinja2_pages_%s.cache"),
+)
+templates = Jinja2Templates(env=template_env)
 
 # Services
 github_service = GitHubService()
@@ -25,17 +40,116 @@ email_service = EmailService()
 pdf_service = PDFService()
 
 
+@app.on_event("startup")
+async def startup():
+    """Compile all templates up front so requests only pay for rendering"""
+    for name in template_env.list_templates():
+        template_env.get_template(name)
+
+    # Render the resume PDFs in the background; startup doesn't wait on them
+    app.state.pdf_prewarm = (
+        asyncio.create_task(_prewarm_pdfs()) if settings.pdf_prewarm else None
+    )
+
+
+async def _prewarm_pdfs() -> None:
+    """Render the resume PDFs once (in parallel) so the first download is served from cache"""
+    try:
+        await asyncio.to_thread(pdf_service.warm)
+    except Exception as e:
+        print(f"Error prewarming resume PDFs: {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release pooled HTTP and SMTP connections"""
+    if app.state.pdf_prewarm is not None:
+        # Stops queued renders; the worker thread returns once running ones finish
+        pdf_service.cancel_warm()
+        app.state.pdf_prewarm.cancel()
+    await github_service.aclose()
+    await asyncio.to_thread(email_service.close)
+
+
+# Browser/proxy cache lifetimes (seconds) for rarely changing responses
+PAGE_MAX_AGE = 3600
+PDF_MAX_AGE = 86400
+
+# Theme preference cookie lifetime (seconds)
+THEME_COOKIE_MAX_AGE = 365 * 86400
+
+
+def _cacheable(
+    request: Request, response: Response, max_age: int, etag: Optional[str] = None
+) -> Response:
+    """Tag a response with an ETag and Cache-Control, answering 304 on a match"""
+    # Callers holding a precomputed ETag skip hashing the body
+    etag = etag or content_etag(response.body)
+    cache_headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    response.headers.update(cache_headers)
+    return response
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header lists the ETag (weak comparison) or is `*`"""
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+async def _github_repositories() -> List[Project]:
+    """GitHub repositories with error handling"""
+    try:
+        return await github_service.get_repositories()
+    except Exception:
+        # If GitHub service fails, continue with empty list
+        return []
+
+
+def _search_matcher(search: str) -> Callable[[str], bool]:
+    """Predicate matching search blobs that contain every word of the query"""
+    terms = search.lower().split()
+    if len(terms) <= 1:
+        # Single word: plain substring test is the fast path
+        query = terms[0] if terms else ""
+        return lambda blob: query in blob
+
+    # Multiple words: one compiled pass with a lookahead per term (AND)
+    pattern = re.compile("".join(f"(?=.*{re.escape(term)})" for term in terms), re.DOTALL)
+    return lambda blob: pattern.match(blob) is not None
+
+
+async def _filtered_projects(search: Optional[str] = None) -> List[Project]:
+    """GitHub and local projects combined, filtered by an optional search term"""
+    # Fetch GitHub repositories and read local projects from JSON concurrently
+    github_repos, local_projects = await asyncio.gather(
+        _github_repositories(),
+        asyncio.to_thread(load_projects),
+    )
+
+    # Combine and filter projects if search term provided
+    all_projects = github_repos + local_projects
+    
+    if search:
+        matches = _search_matcher(search)
+        all_projects = [
+            project for project in all_projects
+            if matches(project.get("_search_blob") or search_blob(project))
+        ]
+    
+    return all_projects
+
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Home page with random GitHub projects"""
     # Get GitHub repositories with error handling
     try:
-        github_repos = await github_service.get_repositories(limit=20)  # Get more repos to have variety
-        
-        # Select 3 random projects (or fewer if less available)
-        import random
-        random_projects = random.sample(github_repos, min(3, len(github_repos))) if github_repos else []
-        
+        # Sample 3 from the 20 latest repos (served from cache) for variety
+        random_projects = await github_service.get_random_repositories(count=3, limit=20)
     except Exception as e:
         print(f"Error fetching GitHub repositories for home page: {e}")
         random_projects = []
@@ -49,35 +163,19 @@ async def home(request: Request):
 @app.get("/about", response_class=HTMLResponse)
 async def about(request: Request):
     """About page"""
-    return templates.TemplateResponse("pages/about.html", {"request": request})
+    return _cacheable(
+        request,
+        templates.TemplateResponse("pages/about.html", {"request": request}),
+        PAGE_MAX_AGE,
+    )
 
 
 @app.get("/projects", response_class=HTMLResponse)
 async def projects(request: Request, search: Optional[str] = None):
     """Projects page with filtering"""
-    # Get GitHub repositories with error handling
-    try:
-        github_repos = await github_service.get_repositories()
-    except Exception:
-        # If GitHub service fails, continue with empty list
-        github_repos = []
-
-    # Get local projects from JSON
-    local_projects = load_projects()
-
-    # Combine and filter projects if search term provided
-    all_projects = github_repos + local_projects
-    
-    if search:
-        all_projects = [
-            project for project in all_projects 
-            if search.lower() in project.get('name', '').lower() or 
-               search.lower() in project.get('description', '').lower()
-        ]
-    
     return templates.TemplateResponse("pages/projects.html", {
         "request": request,
-        "projects": all_projects,
+        "projects": await _filtered_projects(search),
         "search": search or ""
     })
 
@@ -85,7 +183,11 @@ async def projects(request: Request, search: Optional[str] = None):
 @app.get("/contact", response_class=HTMLResponse)
 async def contact(request: Request):
     """Contact page"""
-    return templates.TemplateResponse("pages/contact.html", {"request": request})
+    return _cacheable(
+        request,
+        templates.TemplateResponse("pages/contact.html", {"request": request}),
+        PAGE_MAX_AGE,
+    )
 
 
 @app.post("/contact")
@@ -97,8 +199,8 @@ async def contact_submit(
 ):
     """Handle contact form submission"""
     try:
-        # Save locally
-        save_contact(name, email, message)
+        # Save locally (file I/O runs in a worker thread to keep the event loop free)
+        await asyncio.to_thread(save_contact, name, email, message)
 
         # Send email
         await email_service.send_contact_email(name, email, message)
@@ -116,31 +218,38 @@ async def contact_submit(
 @app.get("/resume", response_class=HTMLResponse)
 async def resume(request: Request):
     """Resume page"""
-    return templates.TemplateResponse("pages/resume.html", {"request": request})
+    return _cacheable(
+        request,
+        templates.TemplateResponse("pages/resume.html", {"request": request}),
+        PAGE_MAX_AGE,
+    )
 
 
 @app.get("/resume/download")
-async def download_resume_pdf(language: str = "en"):
+async def download_resume_pdf(request: Request, language: str = "en"):
     """Download resume as PDF
     
     Args:
         language: Language code ('en' for English, 'pt' for Portuguese)
     """
+    # Anything but a supported language gets the English resume (and its cache entry)
+    language = supported_language(language)
     try:
-        # Generate PDF
-        pdf_content = pdf_service.generate_resume_pdf(language)
+        # Rendered PDF and its ETag, both cached per language
+        pdf_content, etag = pdf_service.resume_pdf(language)
         
         # Set filename based on language
         filename = f"Leonardo_Murakami_Resume_{'PT' if language == 'pt' else 'EN'}.pdf"
         
         # Return PDF response
-        return Response(
+        response = Response(
             content=pdf_content,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}"
             }
         )
+        return _cacheable(request, response, PDF_MAX_AGE, etag=etag)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Error generating PDF. Please try again later.")
 
@@ -149,41 +258,23 @@ async def download_resume_pdf(language: str = "en"):
 @app.get("/htmx/projects/search")
 async def htmx_projects_search(request: Request, q: str = ""):
     """HTMX endpoint for project search"""
-    # Get GitHub repositories with error handling
-    try:
-        github_repos = await github_service.get_repositories()
-    except Exception:
-        # If GitHub service fails, continue with empty list
-        github_repos = []
-
-    # Get local projects from JSON
-    local_projects = load_projects()
-
-    # Combine and filter projects
-    all_projects = github_repos + local_projects
-    
-    if q:
-        all_projects = [
-            project for project in all_projects 
-            if q.lower() in project.get('name', '').lower() or 
-               q.lower() in project.get('description', '').lower()
-        ]
-    
     return templates.TemplateResponse("components/project_list.html", {
         "request": request,
-        "projects": all_projects
+        "projects": await _filtered_projects(q)
     })
 
 
 @app.post("/htmx/theme/toggle")
-async def toggle_theme(request: Request, theme: str = Form(...)):
+async def toggle_theme(request: Request):
     """Toggle theme endpoint for HTMX"""
-    # This endpoint doesn't need to do much since theme is handled client-side
-    # But we return a response to confirm the toggle
-    return templates.TemplateResponse("components/theme_toggle.html", {
+    # Theme state lives in a cookie, so there is no form body to parse
+    theme = "light" if request.cookies.get("theme") == "dark" else "dark"
+    response = templates.TemplateResponse("components/theme_toggle.html", {
         "request": request,
         "current_theme": theme
     })
+    response.set_cookie("theme", theme, max_age=THEME_COOKIE_MAX_AGE, samesite="lax")
+    return response
 
 
 if __name__ == "__main__":
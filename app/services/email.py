@@ -1,10 +1,25 @@
+import asyncio
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import threading
+from contextlib import suppress
+from email.message import EmailMessage
 from typing import Optional
 from ..config import settings
 
 
+CONTACT_EMAIL_BODY = """New contact form submission:
+
+Name: {name}
+Email: {email}
+
+Message:
+{message}
+
+---
+Sent from your portfolio website
+"""
+
+
 class EmailService:
     """Service for sending emails"""
     
@@ -15,6 +30,8 @@ class EmailService:
         self.smtp_password = settings.smtp_password
         self.smtp_from = settings.smtp_from
         self.contact_email = settings.contact_email
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
     
     @property
     def _requires_auth(self) -> bool:
@@ -27,6 +44,49 @@ class EmailService:
             server.login(self.smtp_username, self.smtp_password)
         return server
     
+    def _get_connection(self) -> smtplib.SMTP:
+        """Return the cached SMTP connection, reconnecting if it has dropped"""
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except (smtplib.SMTPException, OSError):
+                self._smtp = None
+        self._smtp = self._create_smtp_connection()
+        return self._smtp
+    
+    def _build_message(self, recipient: str, subject: str, body: str) -> str:
+        """Serialize a plain-text message addressed to `recipient`"""
+        msg = EmailMessage()
+        msg['From'] = self.smtp_from
+        msg['To'] = recipient
+        msg['Subject'] = subject
+        msg.set_content(body)
+        return msg.as_string()
+    
+    def _send_message(self, recipient: str, text: str) -> None:
+        """Send a message over the persistent connection (blocking)"""
+        with self._smtp_lock:
+            server = self._get_connection()
+            try:
+                server.sendmail(self.smtp_from, recipient, text)
+            except Exception:
+                # Close the socket and force a fresh connection on the next send
+                with suppress(smtplib.SMTPException, OSError):
+                    server.close()
+                self._smtp = None
+                raise
+    
+    def close(self) -> None:
+        """Close the persistent SMTP connection"""
+        with self._smtp_lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except (smtplib.SMTPException, OSError):
+                    pass
+                self._smtp = None
+    
     async def send_contact_email(self, name: str, email: str, message: str) -> bool:
         """Send contact form email"""
         if not self.contact_email:
@@ -34,33 +94,14 @@ class EmailService:
             return False
         
         try:
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = self.smtp_from
-            msg['To'] = self.contact_email
-            msg['Subject'] = f"Portfolio Contact Form: Message from {name}"
-            
-            # Email body
-            body = f"""
-            New contact form submission:
-            
-            Name: {name}
-            Email: {email}
-            
-            Message:
-            {message}
+            text = self._build_message(
+                self.contact_email,
+                f"Portfolio Contact Form: Message from {name}",
+                CONTACT_EMAIL_BODY.format(name=name, email=email, message=message),
+            )
             
-            ---
-            Sent from your portfolio website
-            """
-            
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Send email with appropriate configuration
-            server = self._create_smtp_connection()
-            text = msg.as_string()
-            server.sendmail(self.smtp_from, self.contact_email, text)
-            server.quit()
+            # Send email off the event loop, reusing the open connection
+            await asyncio.to_thread(self._send_message, self.contact_email, text)
             
             return True
             
@@ -74,18 +115,10 @@ class EmailService:
             return False
         
         try:
-            msg = MIMEMultipart()
-            msg['From'] = self.smtp_from
-            msg['To'] = self.contact_email
-            msg['Subject'] = subject
-            
-            msg.attach(MIMEText(content, 'plain'))
+            text = self._build_message(self.contact_email, subject, content)
             
-            # Send email with appropriate configuration
-            server = self._create_smtp_connection()
-            text = msg.as_string()
-            server.sendmail(self.smtp_from, self.contact_email, text)
-            server.quit()
+            # Send email off the event loop, reusing the open connection
+            await asyncio.to_thread(self._send_message, self.contact_email, text)
             
             return True
             
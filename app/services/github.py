@@ -1,6 +1,37 @@
+import asyncio
+import random
+import time
 import httpx
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from ..config import settings
+from ..local_data import Project, search_blob
+
+
+# Only the fields used by the site; forks are excluded server-side
+REPOSITORIES_QUERY = """
+query($login: String!, $limit: Int!) {
+  user(login: $login) {
+    repositories(
+      first: $limit
+      isFork: false
+      privacy: PUBLIC
+      ownerAffiliations: OWNER
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      nodes {
+        name
+        description
+        url
+        homepageUrl
+        primaryLanguage { name }
+        stargazerCount
+        updatedAt
+        repositoryTopics(first: 10) { nodes { topic { name } } }
+      }
+    }
+  }
+}
+"""
 
 
 class GitHubService:
@@ -10,57 +41,147 @@ class GitHubService:
         self.base_url = "https://api.github.com"
         self.username = settings.github_username
         self.token = settings.github_token
+        self.cache_ttl = settings.github_cache_ttl
+        self._cache: Dict[int, Tuple[float, List[Project]]] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use so connections are pooled"""
+        if self._client is None:
+            headers = {}
+            if self.token:
+                headers["Authorization"] = f"token {self.token}"
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=headers,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=10),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _get_cached(self, limit: int) -> Optional[List[Project]]:
+        """Return cached repositories for `limit` if still fresh"""
+        entry = self._cache.get(limit)
+        if entry and time.monotonic() - entry[0] < self.cache_ttl:
+            return entry[1]
+        return None
     
-    async def get_repositories(self, limit: int = 10) -> List[Dict]:
-        """Fetch public repositories from GitHub"""
+    async def get_repositories(self, limit: int = 10) -> List[Project]:
+        """Fetch public repositories from GitHub (cached for `cache_ttl` seconds)"""
         if not self.username:
             return []
         
-        headers = {}
-        if self.token:
-            headers["Authorization"] = f"token {self.token}"
+        cached = self._get_cached(limit)
+        if cached is not None:
+            return cached
         
+        # Concurrent callers share a single in-flight fetch
+        async with self._locks.setdefault(limit, asyncio.Lock()):
+            cached = self._get_cached(limit)
+            if cached is not None:
+                return cached
+            
+            repos = await self._fetch_repositories(limit)
+            # Only cache successful fetches so errors are retried
+            if repos is not None:
+                self._cache[limit] = (time.monotonic(), repos)
+            return repos or []
+    
+    async def get_random_repositories(self, count: int = 3, limit: int = 20) -> List[Project]:
+        """Pick `count` random repositories from the (cached) latest `limit`"""
+        repos = await self.get_repositories(limit=limit)
+        return random.sample(repos, min(count, len(repos)))
+    
+    async def _fetch_repositories(self, limit: int) -> Optional[List[Project]]:
+        """Fetch public repositories from the GitHub API, None on failure"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/users/{self.username}/repos",
-                    headers=headers,
-                    params={
-                        "sort": "updated",
-                        "direction": "desc",
-                        "per_page": limit,
-                        "type": "public"
-                    }
-                )
-                response.raise_for_status()
-                
-                repos = response.json()
-                
-                # Transform to our format
-                formatted_repos = []
-                for repo in repos:
-                    # Skip forks unless you want them
-                    if repo.get("fork", False):
-                        continue
-                    
-                    formatted_repo = {
-                        "name": repo["name"],
-                        "description": repo.get("description", ""),
-                        "github_url": repo["html_url"],
-                        "demo_url": repo.get("homepage") if repo.get("homepage") else None,
-                        "technologies": self._extract_technologies(repo),
-                        "stars": repo.get("stargazers_count", 0),
-                        "language": repo.get("language", ""),
-                        "updated_at": repo.get("updated_at", ""),
-                        "source": "github"
-                    }
-                    formatted_repos.append(formatted_repo)
-                
-                return formatted_repos
+            # GraphQL requires authentication but returns only the fields we use
+            if self.token:
+                repos = await self._fetch_repositories_graphql(limit)
+            else:
+                repos = await self._fetch_repositories_rest(limit)
+            
+            # Transform to our format
+            formatted_repos: List[Project] = []
+            for repo in repos:
+                # Skip forks unless you want them
+                if repo.get("fork", False):
+                    continue
                 
+                formatted_repo: Project = {
+                    "name": repo["name"],
+                    "description": repo.get("description", ""),
+                    "github_url": repo["html_url"],
+                    "demo_url": repo.get("homepage") if repo.get("homepage") else None,
+                    "technologies": self._extract_technologies(repo),
+                    "stars": repo.get("stargazers_count", 0),
+                    "language": repo.get("language", ""),
+                    "updated_at": repo.get("updated_at", ""),
+                    "source": "github"
+                }
+                formatted_repo["_search_blob"] = search_blob(formatted_repo)
+                formatted_repos.append(formatted_repo)
+            
+            return formatted_repos
+            
         except Exception as e:
             print(f"Error fetching GitHub repositories: {e}")
-            return []
+            return None
+    
+    async def _fetch_repositories_rest(self, limit: int) -> List[Dict]:
+        """Fetch repositories from the REST API (full ~100-field payload)"""
+        response = await self.client.get(
+            f"/users/{self.username}/repos",
+            params={
+                "sort": "updated",
+                "direction": "desc",
+                "per_page": limit,
+                "type": "public"
+            }
+        )
+        response.raise_for_status()
+        return response.json()
+    
+    async def _fetch_repositories_graphql(self, limit: int) -> List[Dict]:
+        """Fetch repositories from the GraphQL API, shaped like REST results"""
+        response = await self.client.post(
+            "/graphql",
+            json={
+                "query": REPOSITORIES_QUERY,
+                "variables": {"login": self.username, "limit": limit},
+            }
+        )
+        response.raise_for_status()
+        
+        payload = response.json()
+        if payload.get("errors"):
+            raise RuntimeError(payload["errors"][0].get("message", "GraphQL error"))
+        
+        nodes = payload["data"]["user"]["repositories"]["nodes"]
+        return [
+            {
+                "name": node["name"],
+                "description": node.get("description"),
+                "html_url": node["url"],
+                "homepage": node.get("homepageUrl"),
+                "language": (node.get("primaryLanguage") or {}).get("name"),
+                "stargazers_count": node.get("stargazerCount", 0),
+                "updated_at": node.get("updatedAt", ""),
+                "topics": [
+                    topic_node["topic"]["name"]
+                    for topic_node in node["repositoryTopics"]["nodes"]
+                ],
+            }
+            for node in nodes
+        ]
     
     def _extract_technologies(self, repo: Dict) -> str:
         """Extract technologies from repository data"""
@@ -82,18 +203,12 @@ class GitHubService:
         if not self.username:
             return None
         
-        headers = {}
-        if self.token:
-            headers["Authorization"] = f"token {self.token}"
-        
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/repos/{self.username}/{repo_name}/languages",
-                    headers=headers
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self.client.get(
+                f"/repos/{self.username}/{repo_name}/languages"
+            )
+            response.raise_for_status()
+            return response.json()
                 
         except Exception as e:
             print(f"Error fetching repository languages: {e}")
@@ -1,9 +1,113 @@
-import io
-import json
+import hashlib
+import multiprocessing
+import os
+import orjson
+from concurrent.futures import CancelledError, Executor, ProcessPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
-import weasyprint
-from jinja2 import Environment, FileSystemLoader
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple, Union
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+if TYPE_CHECKING:
+    import weasyprint
+    from weasyprint.text.fonts import FontConfiguration
+
+
+RESUME_TEMPLATE = "pdf/resume_pdf.html"
+RESUME_LANGUAGES = ("en", "pt")
+
+# Locale file per supported resume language; paths are never built from request input
+LOCALE_FILES = {language: f"static/locales/{language}.json" for language in RESUME_LANGUAGES}
+
+# Skill categories per resume language (read-only, shared by every render)
+SKILLS_EN = {
+    "Programming Languages": ("Python", "Go", "C/C++", "Bash", "SQL"),
+    "Cloud & Infrastructure": ("AWS", "Kubernetes", "Docker", "Terraform", "Helm"),
+    "Monitoring & Observability": ("Prometheus", "Grafana", "CloudWatch", "Datadog", "ELK Stack"),
+    "Data & ML": ("MLOps", "Data Pipelines", "PostgreSQL", "BigQuery", "Scikit-learn"),
+    "Tools & Methodologies": ("Git", "Linux", "CI/CD", "SLI/SLO", "Incident Response"),
+}
+
+SKILLS_PT = {
+    "Linguagens de Programação": ("Python", "Go", "C/C++", "Bash", "SQL"),
+    "Nuvem e Infraestrutura": ("AWS", "Kubernetes", "Docker", "Terraform", "Helm"),
+    "Monitoramento e Observabilidade": ("Prometheus", "Grafana", "CloudWatch", "Datadog", "ELK Stack"),
+    "Dados e ML": ("MLOps", "Pipelines de Dados", "PostgreSQL", "BigQuery", "Scikit-learn"),
+    "Ferramentas e Metodologias": ("Git", "Linux", "CI/CD", "SLI/SLO", "Resposta a Incidentes"),
+}
+
+
+@lru_cache(maxsize=None)
+def _template_environment(templates_dir: Path) -> Environment:
+    """One Jinja2 environment per templates directory, shared across services"""
+    # Templates don't change at runtime: keep every compiled template, never stat
+    # Compiled bytecode persists in the temp dir so fresh workers skip parsing
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=FileSystemBytecodeCache(pattern="__jinja2_pdf_%s.cache"),
+    )
+
+
+def content_etag(content: Union[bytes, memoryview]) -> str:
+    """Strong ETag for a response body"""
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+@lru_cache(maxsize=None)
+def _font_config() -> "FontConfiguration":
+    """System fonts, discovered once per process and shared by every render"""
+    from weasyprint.text.fonts import FontConfiguration
+    return FontConfiguration()
+
+
+@lru_cache(maxsize=8)
+def _load_locale(path: str) -> dict:
+    """Parsed locale JSON, shared by every service (files are read-only at runtime)"""
+    # Raw bytes in one read; orjson validates the UTF-8 itself
+    return orjson.loads(Path(path).read_bytes())
+
+
+def supported_language(language: str) -> str:
+    """Requested resume language, or English when it isn't one we ship"""
+    return language if language in RESUME_LANGUAGES else "en"
+
+
+def _render_resume(language: str) -> bytes:
+    """Render one resume in a fresh service (process pool entry point)"""
+    return PDFService().generate_resume_pdf(language)
+
+
+def _warm_executor(languages: Sequence[str]) -> ProcessPoolExecutor:
+    """Worker processes for rendering `languages` in parallel
+    
+    Workers are spawned, not forked: the caller runs an event loop and threads
+    that a forked child would inherit mid-state.
+    """
+    return ProcessPoolExecutor(
+        max_workers=min(len(languages), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def warm_all(languages: Sequence[str], executor: Executor) -> Dict[str, bytes]:
+    """Render resumes for every language on `executor`, skipping any that fail
+    
+    Renders are CPU-bound and independent, so wall-clock is the slowest one
+    rather than the sum. One failing language doesn't discard the others.
+    """
+    futures = {language: executor.submit(_render_resume, language) for language in languages}
+    rendered: Dict[str, bytes] = {}
+    for language, future in futures.items():
+        try:
+            rendered[language] = future.result()
+        except CancelledError:
+            # Dropped by `PDFService.cancel_warm` before it started
+            continue
+        except Exception as e:
+            print(f"Error prewarming {language} resume PDF: {e}")
+    return rendered
 
 
 class PDFService:
@@ -11,7 +115,35 @@ class PDFService:
     
     def __init__(self, templates_dir: str = "templates"):
         self.templates_dir = Path(templates_dir)
-        self.env = Environment(loader=FileSystemLoader(self.templates_dir))
+        self.env = _template_environment(self.templates_dir)
+        # Rendered PDFs and their ETags, keyed by the language actually used for the data
+        self._pdf_cache: Dict[str, Tuple[bytes, str]] = {}
+        # Transformed locale data; locale files don't change while running
+        self._resume_data: Dict[str, dict] = {}
+        # Process pool of an in-flight `warm`, so `cancel_warm` can stop it
+        self._warm_pool: Optional[ProcessPoolExecutor] = None
+    
+    def clear_cache(self) -> None:
+        """Drop rendered PDFs and loaded locale data (e.g. after a content deploy)"""
+        self._pdf_cache.clear()
+        self._resume_data.clear()
+    
+    def warm(self, languages: Sequence[str] = RESUME_LANGUAGES) -> None:
+        """Fill the PDF cache with resumes rendered in parallel by `warm_all`"""
+        with _warm_executor(languages) as executor:
+            self._warm_pool = executor
+            try:
+                rendered = warm_all(languages, executor)
+            finally:
+                self._warm_pool = None
+        for language, pdf_content in rendered.items():
+            self._pdf_cache[language] = (pdf_content, content_etag(pdf_content))
+    
+    def cancel_warm(self) -> None:
+        """Drop warm-up renders that haven't started (running ones finish in their worker)"""
+        executor = self._warm_pool
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
     
     def generate_resume_pdf(self, language: str = "en") -> bytes:
         """Generate PDF resume from HTML template
@@ -22,48 +154,70 @@ class PDFService:
         Returns:
             PDF content as bytes
         """
+        return self.resume_pdf(language)[0]
+    
+    def resume_pdf(self, language: str = "en") -> Tuple[bytes, str]:
+        """Rendered resume PDF and its ETag, both computed once per language"""
+        # Unknown languages are served the English resume, so the cache only
+        # ever holds one entry per supported language
+        language = supported_language(language)
+        cached = self._pdf_cache.get(language)
+        if cached is not None:
+            return cached
+        
         # Get the appropriate template data based on language
         template_data = self._get_resume_data(language)
         
-        # Render the PDF template
-        template = self.env.get_template("pdf/resume_pdf.html")
-        html_content = template.render(**template_data)
+        # A broken locale falls back to English; reuse that render
+        resolved_language = template_data.get("language", language)
+        cached = self._pdf_cache.get(resolved_language)
+        if cached is not None:
+            return cached
         
-        # Create CSS for PDF
-        css_content = self._get_pdf_css()
+        # Render the PDF template
+        html_content = self._resume_template.render(**template_data)
         
-        # Generate PDF
+        # Generate PDF (WeasyPrint pulls in cairo/pango, so import it on first render)
+        import weasyprint
         html_doc = weasyprint.HTML(string=html_content)
-        css_doc = weasyprint.CSS(string=css_content)
         
-        pdf_bytes = io.BytesIO()
-        html_doc.write_pdf(pdf_bytes, stylesheets=[css_doc])
-        pdf_bytes.seek(0)
-        
-        return pdf_bytes.getvalue()
+        # With no target, write_pdf returns the document bytes directly
+        pdf_content = html_doc.write_pdf(stylesheets=[self._stylesheet], font_config=_font_config())
+        rendered = (pdf_content, content_etag(pdf_content))
+        self._pdf_cache[resolved_language] = rendered
+        return rendered
+    
+    @cached_property
+    def _resume_template(self) -> Template:
+        """Compiled resume template, looked up once per service"""
+        return self.env.get_template(RESUME_TEMPLATE)
+    
+    @cached_property
+    def _stylesheet(self) -> "weasyprint.CSS":
+        """PDF stylesheet, parsed by WeasyPrint once per service"""
+        import weasyprint
+        return weasyprint.CSS(string=self._get_pdf_css(), font_config=_font_config())
     
     def _get_resume_data(self, language: str) -> dict:
         """Get resume data based on language"""
+        language = supported_language(language)
+        cached = self._resume_data.get(language)
+        if cached is not None:
+            return cached
         
         # Load locale data from JSON files
-        locale_file = Path("static/locales") / f"{language}.json"
-        
         try:
-            with open(locale_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            data = _load_locale(LOCALE_FILES[language])
             # Transform the data structure for the PDF template
-            return self._transform_locale_data(data, language)
-        except FileNotFoundError:
-            # Fallback to English if file not found
-            if language != "en":
-                return self._get_resume_data("en")
-            raise
-        except Exception as e:
-            # Fallback to English for any other error
-            if language != "en":
-                return self._get_resume_data("en")
-            raise
+            resume_data = self._transform_locale_data(data, language)
+        except (FileNotFoundError, orjson.JSONDecodeError, KeyError):
+            # Fallback to English if the file is missing, malformed or incomplete
+            if language == "en":
+                raise
+            return self._get_resume_data("en")
+        
+        self._resume_data[language] = resume_data
+        return resume_data
     
     def _transform_locale_data(self, data: dict, language: str) -> dict:
         """Transform locale data to PDF template format"""
@@ -73,19 +227,7 @@ class PDFService:
             "summary": data["summary"],
             "company": data["company"],
             "experiences": data["roles"],
-            "skills": {
-                "Programming Languages": ["Python", "Go", "C/C++", "Bash", "SQL"],
-                "Cloud & Infrastructure": ["AWS", "Kubernetes", "Docker", "Terraform", "Helm"],
-                "Monitoring & Observability": ["Prometheus", "Grafana", "CloudWatch", "Datadog", "ELK Stack"],
-                "Data & ML": ["MLOps", "Data Pipelines", "PostgreSQL", "BigQuery", "Scikit-learn"],
-                "Tools & Methodologies": ["Git", "Linux", "CI/CD", "SLI/SLO", "Incident Response"]
-            } if language == "en" else {
-                "Linguagens de Programação": ["Python", "Go", "C/C++", "Bash", "SQL"],
-                "Nuvem e Infraestrutura": ["AWS", "Kubernetes", "Docker", "Terraform", "Helm"],
-                "Monitoramento e Observabilidade": ["Prometheus", "Grafana", "CloudWatch", "Datadog", "ELK Stack"],
-                "Dados e ML": ["MLOps", "Pipelines de Dados", "PostgreSQL", "BigQuery", "Scikit-learn"],
-                "Ferramentas e Metodologias": ["Git", "Linux", "CI/CD", "SLI/SLO", "Resposta a Incidentes"]
-            },
+            "skills": SKILLS_EN if language == "en" else SKILLS_PT,
             "education": data["education"]
         }
     
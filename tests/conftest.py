@@ -2,21 +2,57 @@
 Shared pytest fixtures and configuration
 """
 import os
+
+# Set before any app import: the settings singleton (and the services built
+# from it) are created at import time, and TESTING turns off .env loading
+os.environ["TESTING"] = "1"
+
+import json
 import tempfile
+from pathlib import Path
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock
 from fastapi.testclient import TestClient
-from pathlib import Path
-import json
 
-from app.main import app
+from app.main import app, pdf_service
 from app.config import Settings
+from tests.fixtures.sample_data import _freeze, create_temp_locale_files, create_temp_projects_file
 
+try:
+    from pytest_socket import disable_socket, enable_socket
+except ImportError:
+    # pytest-socket is a dev dependency; without it tests run unguarded
+    disable_socket = enable_socket = None
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def client():
-    """Test client for FastAPI app"""
-    return TestClient(app)
+    """Test client for FastAPI app, shared across the session (startup/shutdown run once)"""
+    with pytest.MonkeyPatch.context() as mp:
+        # Startup would otherwise spawn worker processes and render real PDFs
+        mp.setattr(pdf_service, "warm", Mock())
+        with TestClient(app) as test_client:
+            # Warm the OpenAPI schema and page renders so no test pays first-hit costs;
+            # this runs before the per-test no_network guard, so guard it here too
+            if disable_socket is not None:
+                disable_socket(allow_unix_socket=True)
+            try:
+                test_client.get("/openapi.json")
+                for path in ("/", "/about", "/contact", "/resume"):
+                    test_client.get(path)
+            finally:
+                if enable_socket is not None:
+                    enable_socket()
+            yield test_client
+
+
+@pytest.fixture
+def fresh_client(monkeypatch):
+    """Test client for tests that need their own app lifecycle (warm is a Mock)"""
+    monkeypatch.setattr(pdf_service, "warm", Mock())
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
@@ -35,9 +71,38 @@ def mock_settings():
     )
 
 
+@pytest.fixture(scope="session")
+def mock_github_response():
+    """Mock GitHub API response (read-only, shared by the session)"""
+    return _freeze([
+        {
+            "name": "test-repo",
+            "description": "Test repository",
+            "html_url": "https://github.com/testuser/test-repo",
+            "homepage": "https://test-repo.com",
+            "stargazers_count": 5,
+            "language": "Python",
+            "updated_at": "2023-01-01T00:00:00Z",
+            "fork": False,
+            "topics": ["fastapi", "python"]
+        }
+    ])
+
+
 @pytest.fixture
+def mock_httpx_client(monkeypatch):
+    """Mock httpx.AsyncClient instance (get/post are AsyncMocks) handed to services"""
+    client = Mock(get=AsyncMock(), post=AsyncMock())
+    monkeypatch.setattr("app.services.github.httpx.AsyncClient", lambda *args, **kwargs: client)
+    return client
+
+
+@pytest.fixture(scope="session")
 def temp_data_dir():
-    """Temporary directory for test data files"""
+    """Temporary directory for test data files, created once per session.
+
+    Shared by every test: treat it as read-only.
+    """
     with tempfile.TemporaryDirectory() as temp_dir:
         # Create test data structure
         data_dir = Path(temp_dir) / "static" / "data"
@@ -62,92 +127,66 @@ def temp_data_dir():
         yield temp_dir
 
 
-@pytest.fixture
-def mock_github_response():
-    """Mock GitHub API response"""
-    return [
-        {
-            "name": "test-repo",
-            "description": "Test repository",
-            "html_url": "https://github.com/testuser/test-repo",
-            "homepage": "https://test-repo.com",
-            "stargazers_count": 5,
-            "language": "Python",
-            "updated_at": "2023-01-01T00:00:00Z",
-            "fork": False,
-            "topics": ["fastapi", "python"]
-        }
-    ]
+@pytest.fixture(scope="session")
+def sample_projects_file(tmp_path_factory):
+    """Sample projects.json written once per session (copy to tmp_path before mutating)"""
+    return create_temp_projects_file(tmp_path_factory.mktemp("data"))
 
 
-@pytest.fixture
-def mock_httpx_client():
-    """Mock httpx.AsyncClient"""
-    with patch("httpx.AsyncClient") as mock_client:
-        yield mock_client
-
-
-@pytest.fixture
-def mock_smtp_server():
-    """Mock SMTP server"""
-    with patch("smtplib.SMTP") as mock_smtp:
-        mock_server = Mock()
-        mock_smtp.return_value = mock_server
-        yield mock_server
+@pytest.fixture(scope="session")
+def sample_locale_files(tmp_path_factory):
+    """Sample en/pt locale files written once per session (copy before mutating)"""
+    return create_temp_locale_files(tmp_path_factory.mktemp("locales"))
 
 
 @pytest.fixture
-def mock_weasyprint():
+def mock_weasyprint(monkeypatch):
     """Mock WeasyPrint for PDF generation"""
-    with patch("weasyprint.HTML") as mock_html, \
-         patch("weasyprint.CSS") as mock_css:
-        mock_html_instance = Mock()
-        mock_css_instance = Mock()
-        mock_html.return_value = mock_html_instance
-        mock_css.return_value = mock_css_instance
-        
-        # Mock PDF bytes
-        mock_html_instance.write_pdf.return_value = None
-        
-        yield {
-            "html": mock_html,
-            "css": mock_css,
-            "html_instance": mock_html_instance,
-            "css_instance": mock_css_instance
-        }
+    mock_html_instance = Mock()
+    mock_css_instance = Mock()
+    mock_html = Mock(return_value=mock_html_instance)
+    mock_css = Mock(return_value=mock_css_instance)
+    monkeypatch.setattr("weasyprint.HTML", mock_html)
+    monkeypatch.setattr("weasyprint.CSS", mock_css)
+    
+    # Mock PDF bytes
+    mock_html_instance.write_pdf.return_value = b"fake_pdf_content"
+    
+    return {
+        "html": mock_html,
+        "css": mock_css,
+        "html_instance": mock_html_instance,
+        "css_instance": mock_css_instance
+    }
 
 
 @pytest.fixture(autouse=True)
-def setup_test_environment():
-    """Setup test environment variables and paths"""
-    # Set test environment
-    os.environ["TESTING"] = "1"
-    
-    # Ensure we don't accidentally use real files
-    original_cwd = os.getcwd()
+def no_network():
+    """Fail fast if a missing mock lets a test reach the network"""
+    if disable_socket is None:
+        yield
+        return
     
+    # Unix sockets stay allowed: event loops use a socketpair internally
+    disable_socket(allow_unix_socket=True)
     yield
-    
-    # Cleanup
-    os.chdir(original_cwd)
-    if "TESTING" in os.environ:
-        del os.environ["TESTING"]
+    enable_socket()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_contact_data():
-    """Sample contact form data"""
-    return {
+    """Sample contact form data (read-only, shared by the session)"""
+    return _freeze({
         "name": "John Doe",
         "email": "john@example.com",
         "message": "This is a test message"
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_locales():
-    """Sample locale data for PDF generation"""
-    return {
+    """Sample locale data for PDF generation (read-only, shared by the session)"""
+    return _freeze({
         "en": {
             "personal": {
                 "name": "John Doe",
@@ -174,4 +213,4 @@ def sample_locales():
                 "description": "Studied computer science"
             }
         }
-    }
+    })
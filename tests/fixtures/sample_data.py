@@ -1,11 +1,22 @@
 """
 Sample data for testing
 """
-import json
+import orjson
 from pathlib import Path
+from types import MappingProxyType
+
+
+def _freeze(value):
+    """Read-only deep copy: dicts become mapping proxies, lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 
 # Sample projects data
-SAMPLE_PROJECTS = [
+SAMPLE_PROJECTS = (
     {
         "name": "Portfolio Website",
         "description": "Personal portfolio built with FastAPI and HTMX",
@@ -21,10 +32,10 @@ SAMPLE_PROJECTS = [
         "technologies": "Python, FastAPI, PostgreSQL",
         "source": "local"
     }
-]
+)
 
 # Sample GitHub API response
-SAMPLE_GITHUB_REPOS = [
+SAMPLE_GITHUB_REPOS = (
     {
         "name": "awesome-project",
         "description": "An awesome open source project",
@@ -47,10 +58,10 @@ SAMPLE_GITHUB_REPOS = [
         "fork": False,
         "topics": ["go", "cli", "utility"]
     }
-]
+)
 
 # Sample contact submissions
-SAMPLE_CONTACTS = [
+SAMPLE_CONTACTS = (
     {
         "name": "Alice Johnson",
         "email": "alice@example.com",
@@ -61,18 +72,19 @@ SAMPLE_CONTACTS = [
         "email": "bob.smith@company.com", 
         "message": "Interested in your API service. Can we schedule a call?"
     }
-]
+)
+
+# Sample resume/locale data (contact details are language independent)
+_CONTACT = {
+    "name": "Leonardo Murakami",
+    "email": "leonardo@example.com",
+    "phone": "+55 11 99999-9999",
+    "linkedin": "linkedin.com/in/leonardo-murakami",
+    "github": "github.com/leonardo-murakami"
+}
 
-# Sample resume/locale data
 SAMPLE_RESUME_EN = {
-    "personal": {
-        "name": "Leonardo Murakami",
-        "title": "Software Engineer & Site Reliability Engineer",
-        "email": "leonardo@example.com",
-        "phone": "+55 11 99999-9999",
-        "linkedin": "linkedin.com/in/leonardo-murakami",
-        "github": "github.com/leonardo-murakami"
-    },
+    "personal": {**_CONTACT, "title": "Software Engineer & Site Reliability Engineer"},
     "summary": "Experienced software engineer with expertise in cloud infrastructure, automation, and scalable systems.",
     "company": {
         "name": "Tech Company",
@@ -107,14 +119,7 @@ SAMPLE_RESUME_EN = {
 }
 
 SAMPLE_RESUME_PT = {
-    "personal": {
-        "name": "Leonardo Murakami",
-        "title": "Engenheiro de Software & Engenheiro de Confiabilidade",
-        "email": "leonardo@example.com",
-        "phone": "+55 11 99999-9999",
-        "linkedin": "linkedin.com/in/leonardo-murakami",
-        "github": "github.com/leonardo-murakami"
-    },
+    "personal": {**_CONTACT, "title": "Engenheiro de Software & Engenheiro de Confiabilidade"},
     "summary": "Engenheiro de software experiente com expertise em infraestrutura na nuvem, automação e sistemas escaláveis.",
     "company": {
         "name": "Empresa de Tecnologia",
@@ -139,6 +144,18 @@ SAMPLE_RESUME_PT = {
     }
 }
 
+# Shared across tests, so freeze them against accidental mutation
+SAMPLE_PROJECTS = _freeze(SAMPLE_PROJECTS)
+SAMPLE_GITHUB_REPOS = _freeze(SAMPLE_GITHUB_REPOS)
+SAMPLE_CONTACTS = _freeze(SAMPLE_CONTACTS)
+SAMPLE_RESUME_EN = _freeze(SAMPLE_RESUME_EN)
+SAMPLE_RESUME_PT = _freeze(SAMPLE_RESUME_PT)
+
+# Serialized once at import; helpers only write the bytes
+_SAMPLE_PROJECTS_BYTES = orjson.dumps(SAMPLE_PROJECTS, default=dict, option=orjson.OPT_INDENT_2)
+_SAMPLE_RESUME_EN_BYTES = orjson.dumps(SAMPLE_RESUME_EN, default=dict, option=orjson.OPT_INDENT_2)
+_SAMPLE_RESUME_PT_BYTES = orjson.dumps(SAMPLE_RESUME_PT, default=dict, option=orjson.OPT_INDENT_2)
+
 
 def create_temp_projects_file(temp_dir: Path) -> Path:
     """Create temporary projects.json file for testing"""
@@ -146,8 +163,7 @@ def create_temp_projects_file(temp_dir: Path) -> Path:
     data_dir.mkdir(parents=True, exist_ok=True)
     
     projects_file = data_dir / "projects.json"
-    with projects_file.open("w") as f:
-        json.dump(SAMPLE_PROJECTS, f, indent=2)
+    projects_file.write_bytes(_SAMPLE_PROJECTS_BYTES)
     
     return projects_file
 
@@ -160,10 +176,7 @@ def create_temp_locale_files(temp_dir: Path) -> tuple[Path, Path]:
     en_file = locales_dir / "en.json"
     pt_file = locales_dir / "pt.json"
     
-    with en_file.open("w") as f:
-        json.dump(SAMPLE_RESUME_EN, f, indent=2)
-    
-    with pt_file.open("w") as f:
-        json.dump(SAMPLE_RESUME_PT, f, indent=2)
+    en_file.write_bytes(_SAMPLE_RESUME_EN_BYTES)
+    pt_file.write_bytes(_SAMPLE_RESUME_PT_BYTES)
     
     return en_file, pt_file
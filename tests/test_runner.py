@@ -2,6 +2,7 @@
 Simple test runner script for development
 Run with: python tests/test_runner.py
 """
+import os
 import pytest
 import sys
 from pathlib import Path
@@ -19,13 +20,17 @@ def run_tests():
         "--tb=short"
     ]
     
-    # Add coverage if pytest-cov is available
+    # Add coverage if pytest-cov is available (FAST=1 skips tracing entirely)
     try:
         import pytest_cov
-        args.extend([
-            "--cov=app",
-            "--cov-report=term-missing"
-        ])
+        if os.environ.get("FAST"):
+            args.append("--no-cov")
+        else:
+            args.extend([
+                "--cov=app",
+                "--cov-report=term",
+                "--no-cov-on-fail"
+            ])
     except ImportError:
         print("pytest-cov not available, running without coverage")
     
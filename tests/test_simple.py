@@ -7,6 +7,13 @@ from unittest.mock import patch, Mock
 
 from app.main import app
 from app.config import Settings
+from app.services.pdf import content_etag
+
+
+PAGE_PATHS = ["/", "/about", "/contact", "/resume"]
+
+# (PDF bytes, ETag) as returned by PDFService.resume_pdf
+FAKE_PDF = (b"fake_pdf_content", content_etag(b"fake_pdf_content"))
 
 
 class TestSimpleWorking:
@@ -17,25 +24,10 @@ class TestSimpleWorking:
         assert app is not None
         assert app.title == "Personal Portfolio"
 
-    def test_basic_endpoints(self):
-        """Test basic endpoints work"""
-        client = TestClient(app)
-        
-        # Test home page
-        response = client.get("/")
-        assert response.status_code == 200
-        
-        # Test about page  
-        response = client.get("/about")
-        assert response.status_code == 200
-        
-        # Test contact page
-        response = client.get("/contact")
-        assert response.status_code == 200
-        
-        # Test resume page
-        response = client.get("/resume")
-        assert response.status_code == 200
+    @pytest.mark.parametrize("path", PAGE_PATHS)
+    def test_page_loads(self, client, path):
+        """Test basic page endpoints work"""
+        assert client.get(path).status_code == 200
 
     def test_config_basic(self):
         """Test basic configuration"""
@@ -51,10 +43,8 @@ class TestSimpleWorking:
 
     @patch('app.main.github_service.get_repositories')
     @patch('app.main.load_projects')
-    def test_projects_endpoint_basic(self, mock_load_projects, mock_github_repos):
+    def test_projects_endpoint_basic(self, mock_load_projects, mock_github_repos, client):
         """Test projects endpoint with basic mocking"""
-        client = TestClient(app)
-        
         # Mock return values
         mock_github_repos.return_value = []
         mock_load_projects.return_value = []
@@ -62,25 +52,17 @@ class TestSimpleWorking:
         response = client.get("/projects")
         assert response.status_code == 200
 
-    def test_missing_template_handling(self):
-        """Test how app handles missing templates"""
-        client = TestClient(app)
-        
-        # This should fail gracefully, not crash the app
-        try:
-            response = client.post("/htmx/theme/toggle", data={"theme": "dark"})
-            # Either it works or it returns a proper error
-            assert response.status_code in [200, 404, 500]
-        except Exception:
-            # Template missing is expected in test environment
-            pass
-
-    @patch('app.main.pdf_service.generate_resume_pdf')
-    def test_pdf_download_basic(self, mock_generate_pdf):
+    def test_missing_template_handling(self, client):
+        """Test that the theme toggle component template renders"""
+        # The toggle reads the current theme from its cookie and flips it
+        response = client.post("/htmx/theme/toggle", cookies={"theme": "dark"})
+        assert response.status_code == 200
+        assert "theme=light" in response.headers["set-cookie"]
+
+    @patch('app.main.pdf_service.resume_pdf')
+    def test_pdf_download_basic(self, mock_resume_pdf, client):
         """Test PDF download with basic mocking"""
-        client = TestClient(app)
-        
-        mock_generate_pdf.return_value = b"fake_pdf_content"
+        mock_resume_pdf.return_value = FAKE_PDF
         
         response = client.get("/resume/download")
         assert response.status_code == 200
@@ -88,10 +70,8 @@ class TestSimpleWorking:
 
     @patch('app.main.save_contact')
     @patch('app.main.email_service.send_contact_email')
-    def test_contact_form_basic(self, mock_email, mock_save):
+    def test_contact_form_basic(self, mock_email, mock_save, client):
         """Test contact form with basic mocking"""
-        client = TestClient(app)
-        
         mock_email.return_value = True
         
         contact_data = {
@@ -106,7 +86,7 @@ class TestSimpleWorking:
         mock_email.assert_called_once()
 
 
-def test_run_simple_tests():
+def test_run_simple_tests(client):
     """Simple function to run these tests manually"""
     test_class = TestSimpleWorking()
     
@@ -115,7 +95,8 @@ def test_run_simple_tests():
     test_class.test_app_creation()
     print("✅ App creation test passed")
     
-    test_class.test_basic_endpoints()
+    for path in PAGE_PATHS:
+        test_class.test_page_loads(client, path)
     print("✅ Basic endpoints test passed")
     
     test_class.test_config_basic()
@@ -125,4 +106,5 @@ def test_run_simple_tests():
 
 
 if __name__ == "__main__":
-    test_run_simple_tests()
+    with TestClient(app) as client:
+        test_run_simple_tests(client)
@@ -3,28 +3,32 @@ Tests for configuration management
 """
 import pytest
 import os
-from unittest.mock import patch
 
 from app.config import Settings
 
 
+@pytest.fixture
+def empty_environ(monkeypatch):
+    """Empty process environment for the test (swapped, not copied; undone by monkeypatch)"""
+    monkeypatch.setattr(os, "environ", {})
+    return monkeypatch
+
+
 class TestSettings:
     """Test configuration settings"""
 
-    def test_default_settings(self):
+    def test_default_settings(self, empty_environ):
         """Test default settings values"""
-        # Clear environment to test defaults and disable .env file loading
-        with patch.dict(os.environ, {}, clear=True):
-            settings = Settings(_env_file=None)
+        settings = Settings()
         
-            assert settings.smtp_host == "smtp.gmail.com"
-            assert settings.smtp_port == 587
-            assert settings.secret_key == "your-secret-key-change-this"
-            assert settings.debug is True
-            assert settings.github_username is None
-            assert settings.github_token is None
+        assert settings.smtp_host == "smtp.gmail.com"
+        assert settings.smtp_port == 587
+        assert settings.secret_key == "your-secret-key-change-this"
+        assert settings.debug is True
+        assert settings.github_username is None
+        assert settings.github_token is None
 
-    def test_settings_from_env_vars(self):
+    def test_settings_from_env_vars(self, monkeypatch):
         """Test settings loading from environment variables"""
         env_vars = {
             "GITHUB_USERNAME": "testuser",
@@ -36,29 +40,31 @@ class TestSettings:
             "DEBUG": "false"
         }
         
-        with patch.dict(os.environ, env_vars):
-            settings = Settings()
-            
-            assert settings.github_username == "testuser"
-            assert settings.github_token == "token123"
-            assert settings.smtp_username == "test@example.com"
-            assert settings.smtp_password == "password123"
-            assert settings.contact_email == "contact@example.com"
-            assert settings.secret_key == "super-secret-key"
-            assert settings.debug is False
+        for key, value in env_vars.items():
+            monkeypatch.setenv(key, value)
+        settings = Settings()
+        
+        assert settings.github_username == "testuser"
+        assert settings.github_token == "token123"
+        assert settings.smtp_username == "test@example.com"
+        assert settings.smtp_password == "password123"
+        assert settings.contact_email == "contact@example.com"
+        assert settings.secret_key == "super-secret-key"
+        assert settings.debug is False
 
-    def test_settings_case_insensitive(self):
+    def test_settings_case_insensitive(self, empty_environ):
         """Test that settings are case insensitive"""
         env_vars = {
             "github_username": "testuser",  # lowercase
             "GITHUB_TOKEN": "token123",     # uppercase
         }
         
-        with patch.dict(os.environ, env_vars, clear=True):
-            settings = Settings()
-            
-            assert settings.github_username == "testuser"
-            assert settings.github_token == "token123"
+        for key, value in env_vars.items():
+            empty_environ.setenv(key, value)
+        settings = Settings()
+        
+        assert settings.github_username == "testuser"
+        assert settings.github_token == "token123"
 
     def test_settings_with_custom_values(self):
         """Test settings with custom initialization values"""
@@ -92,7 +98,7 @@ class TestSettings:
         assert custom_settings.smtp_host == "mail.example.com"
         assert custom_settings.smtp_port == 465
 
-    def test_email_configuration_completeness(self):
+    def test_email_configuration_completeness(self, empty_environ):
         """Test email configuration completeness scenarios"""
         # Complete configuration
         complete_config = Settings(
@@ -105,9 +111,8 @@ class TestSettings:
         assert complete_config.smtp_password is not None
         assert complete_config.contact_email is not None
         
-        # Incomplete configuration - clear env to test defaults
-        with patch.dict(os.environ, {}, clear=True):
-            incomplete_config = Settings(_env_file=None)
-            assert incomplete_config.smtp_username is None
-            assert incomplete_config.smtp_password is None
-            assert incomplete_config.contact_email is None
+        # Incomplete configuration - empty environment to test defaults
+        incomplete_config = Settings()
+        assert incomplete_config.smtp_username is None
+        assert incomplete_config.smtp_password is None
+        assert incomplete_config.contact_email is None
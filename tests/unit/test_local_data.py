@@ -2,21 +2,52 @@
 Tests for local data management
 """
 import json
+import orjson
 import pytest
 from pathlib import Path
-from unittest.mock import patch, mock_open
+from unittest.mock import DEFAULT, Mock, patch, mock_open
 
-from app.local_data import load_projects, save_contact
+from app import local_data
+from app.local_data import load_contacts, load_projects, save_contact
 
 
 class TestLocalData:
     """Test local data file operations"""
 
-    @patch.object(Path, 'exists')
-    @patch.object(Path, 'open', new_callable=mock_open)
-    def test_load_projects_file_exists(self, mock_file, mock_exists):
+    @pytest.fixture(autouse=True)
+    def reset_projects_cache(self, monkeypatch):
+        """Start every test with an empty projects cache"""
+        monkeypatch.setattr(local_data, "_projects_cache", None)
+
+    @pytest.fixture(scope="class")
+    def file_mock(self):
+        """One mock_open tree for the whole class, reset between tests"""
+        return mock_open()
+
+    @pytest.fixture(autouse=True)
+    def path_mocks(self, file_mock):
+        """Patch the Path file operations once per test; configure them inline"""
+        file_mock.reset_mock()
+        with patch.multiple(
+            Path, stat=DEFAULT, exists=DEFAULT, mkdir=DEFAULT, read_bytes=DEFAULT, open=file_mock
+        ) as mocks:
+            mocks["open"] = file_mock
+            mocks["stat"].return_value = Mock(st_mtime_ns=1)
+            mocks["exists"].return_value = False
+            self.mocks = mocks
+            yield mocks
+
+    def written_contact(self):
+        """Contact from the single line appended to the contacts file"""
+        self.mocks["open"].assert_called_once_with("ab")
+        write = self.mocks["open"].return_value.write
+        write.assert_called_once()
+        line = write.call_args.args[0]
+        assert line.endswith(b"\n") and line.count(b"\n") == 1
+        return orjson.loads(line)
+
+    def test_load_projects_file_exists(self):
         """Test loading projects when file exists"""
-        mock_exists.return_value = True
         test_projects = [
             {
                 "name": "Test Project",
@@ -24,28 +55,26 @@ class TestLocalData:
                 "technologies": "Python, FastAPI"
             }
         ]
-        mock_file.return_value.read.return_value = json.dumps(test_projects)
+        self.mocks["read_bytes"].return_value = json.dumps(test_projects).encode()
 
         result = load_projects()
         
-        assert result == test_projects
-        mock_file.assert_called_once()
+        assert len(result) == 1
+        assert result[0]["name"] == "Test Project"
+        assert result[0]["_search_blob"] == "test project a test project"
+        self.mocks["read_bytes"].assert_called_once()
 
-    @patch.object(Path, 'exists')
-    def test_load_projects_file_not_exists(self, mock_exists):
+    def test_load_projects_file_not_exists(self):
         """Test loading projects when file doesn't exist"""
-        mock_exists.return_value = False
+        self.mocks["stat"].side_effect = FileNotFoundError
 
         result = load_projects()
         
         assert result == []
 
-    @patch.object(Path, 'exists')
-    @patch.object(Path, 'open', new_callable=mock_open)
-    def test_load_projects_json_decode_error(self, mock_file, mock_exists):
+    def test_load_projects_json_decode_error(self):
         """Test loading projects with invalid JSON"""
-        mock_exists.return_value = True
-        mock_file.return_value.read.return_value = "invalid json"
+        self.mocks["read_bytes"].return_value = b"invalid json"
 
         # Should not raise exception, but might return empty list
         # depending on implementation
@@ -56,110 +85,104 @@ class TestLocalData:
             # this test documents that behavior
             pass
 
-    @patch.object(Path, 'mkdir')
-    @patch.object(Path, 'exists')
-    @patch.object(Path, 'open', new_callable=mock_open)
-    def test_save_contact_new_file(self, mock_file, mock_exists, mock_mkdir):
+    def test_save_contact_new_file(self):
         """Test saving contact when contacts file doesn't exist"""
-        mock_exists.return_value = False
-        
         save_contact("John Doe", "john@example.com", "Test message")
         
-        # Should create directory and write new contact
-        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
-        assert mock_file.call_count == 1
-        
-        # Check that the contact data was written  
-        # The mock_open write calls are captured in mock_file().write.call_args_list
-        write_calls = mock_file.return_value.write.call_args_list
-        assert len(write_calls) > 0
+        # Should create directory and append the new contact
+        self.mocks["mkdir"].assert_called_once_with(parents=True, exist_ok=True)
         
-        # json.dump writes in multiple calls, so we need to collect all written data
-        written_data = ''.join(call[0][0] for call in write_calls)
-        contacts_data = json.loads(written_data)
+        # Check that the contact data was written
+        contact = self.written_contact()
         
-        assert len(contacts_data) == 1
-        assert contacts_data[0]["name"] == "John Doe"
-        assert contacts_data[0]["email"] == "john@example.com"
-        assert contacts_data[0]["message"] == "Test message"
+        assert contact["name"] == "John Doe"
+        assert contact["email"] == "john@example.com"
+        assert contact["message"] == "Test message"
 
-    @patch.object(Path, 'mkdir')
-    @patch.object(Path, 'exists')
-    @patch.object(Path, 'open', new_callable=mock_open)
-    def test_save_contact_existing_file(self, mock_file, mock_exists, mock_mkdir):
+    def test_save_contact_existing_file(self):
         """Test saving contact when contacts file already exists"""
-        mock_exists.return_value = True
-        existing_contacts = [
-            {"name": "Jane Smith", "email": "jane@example.com", "message": "Previous message"}
-        ]
-        
-        # Mock reading existing file
-        mock_file.return_value.read.return_value = json.dumps(existing_contacts)
+        self.mocks["exists"].return_value = True
 
         save_contact("John Doe", "john@example.com", "New message")
         
-        # Should read existing file and append new contact
-        assert mock_file.call_count == 2  # One read, one write
-        
-        # Get the written data from the write calls
-        write_calls = mock_file.return_value.write.call_args_list
-        if write_calls:
-            # json.dump writes in multiple calls, so we need to collect all written data
-            written_data = ''.join(call[0][0] for call in write_calls)
-            contacts_data = json.loads(written_data)
-            
-            assert len(contacts_data) == 2
-            assert contacts_data[1]["name"] == "John Doe"
-            assert contacts_data[1]["email"] == "john@example.com"
-            assert contacts_data[1]["message"] == "New message"
-
-    @patch.object(Path, 'exists')
-    def test_projects_file_path(self, mock_exists):
+        # Existing contacts are never read back: only one line is appended
+        self.mocks["open"].return_value.read.assert_not_called()
+        assert self.written_contact() == {
+            "name": "John Doe", "email": "john@example.com", "message": "New message"
+        }
+
+    def test_projects_file_path(self):
         """Test that projects file path is correct"""
-        mock_exists.return_value = False
+        self.mocks["stat"].side_effect = FileNotFoundError
         load_projects()
         
         # Should check the correct file path
-        mock_exists.assert_called_with()
+        self.mocks["stat"].assert_called_with()
+
+    def test_load_projects_cached_until_modified(self):
+        """Test that projects are only re-parsed when the file's mtime changes"""
+        self.mocks["read_bytes"].return_value = json.dumps([{"name": "Cached"}]).encode()
+
+        first = load_projects()
+        second = load_projects()
+        
+        assert second is first
+        self.mocks["read_bytes"].assert_called_once()
+        
+        self.mocks["stat"].return_value = Mock(st_mtime_ns=2)
+        load_projects()
+        
+        assert self.mocks["read_bytes"].call_count == 2
 
     def test_contact_data_format(self):
         """Test contact data format requirements"""
-        with patch.object(Path, 'mkdir'), \
-             patch.object(Path, 'exists', return_value=False), \
-             patch.object(Path, 'open', mock_open()) as mock_file:
-
-            save_contact("Test User", "test@example.com", "Test message with special chars: éñ中")
-            
-            # Verify the data was written
-            write_calls = mock_file.return_value.write.call_args_list
-            assert len(write_calls) > 0
-            
-            # json.dump writes in multiple calls, so we need to collect all written data
-            written_data = ''.join(call[0][0] for call in write_calls)
-            contacts_data = json.loads(written_data)
-            
-            contact = contacts_data[0]
-            assert "name" in contact
-            assert "email" in contact
-            assert "message" in contact
-            assert contact["message"] == "Test message with special chars: éñ中"
+        save_contact("Test User", "test@example.com", "Test message with special chars: éñ中")
+        
+        # Verify the data was written
+        contact = self.written_contact()
+        
+        assert "name" in contact
+        assert "email" in contact
+        assert "message" in contact
+        assert contact["message"] == "Test message with special chars: éñ中"
 
     def test_empty_contact_data(self):
         """Test saving contact with empty data"""
-        with patch.object(Path, 'mkdir'), \
-             patch.object(Path, 'exists', return_value=False), \
-             patch.object(Path, 'open', mock_open()) as mock_file:
-
-            save_contact("", "", "")
-            
-            write_calls = mock_file.return_value.write.call_args_list
-            assert len(write_calls) > 0
-            
-            # json.dump writes in multiple calls, so we need to collect all written data
-            written_data = ''.join(call[0][0] for call in write_calls)
-            contacts_data = json.loads(written_data)
-            
-            contact = contacts_data[0]
-            assert contact["name"] == ""
-            assert contact["email"] == ""
-            assert contact["message"] == ""
+        save_contact("", "", "")
+        
+        contact = self.written_contact()
+        
+        assert contact["name"] == ""
+        assert contact["email"] == ""
+        assert contact["message"] == ""
+
+    def test_load_contacts(self, monkeypatch):
+        """Test streaming contacts back from the JSON Lines file"""
+        self.mocks["read_bytes"].side_effect = FileNotFoundError
+        self.mocks["exists"].return_value = True
+        lines = [
+            json.dumps({"name": "Jane Smith", "email": "jane@example.com", "message": "Hi"}).encode() + b"\n",
+            b"\n",
+            json.dumps({"name": "John Doe", "email": "john@example.com", "message": "Hello"}).encode() + b"\n",
+        ]
+        # monkeypatch restores mock_open's own iterator for the tests that follow
+        monkeypatch.setattr(self.mocks["open"].return_value.__iter__, "side_effect", lambda: iter(lines))
+        
+        contacts = list(load_contacts())
+        
+        assert [contact["name"] for contact in contacts] == ["Jane Smith", "John Doe"]
+
+    def test_load_contacts_legacy_file(self):
+        """Test that submissions in the legacy JSON array file are still returned"""
+        self.mocks["read_bytes"].return_value = json.dumps([
+            {"name": "Old Contact", "email": "old@example.com", "message": "Saved before JSON Lines"}
+        ]).encode()
+        
+        contacts = list(load_contacts())
+        
+        assert [contact["name"] for contact in contacts] == ["Old Contact"]
+
+    def test_load_contacts_no_file(self):
+        """Test that no contacts are yielded before the first submission"""
+        self.mocks["read_bytes"].side_effect = FileNotFoundError
+        assert list(load_contacts()) == []
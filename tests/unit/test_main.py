@@ -2,46 +2,65 @@
 Tests for the main FastAPI application
 """
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, Mock, AsyncMock
 from fastapi import status
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.services.pdf import content_etag
+
+
+# Exact Content-Disposition headers sent with the resume downloads
+EXPECTED_CD_EN = "attachment; filename=Leonardo_Murakami_Resume_EN.pdf"
+EXPECTED_CD_PT = "attachment; filename=Leonardo_Murakami_Resume_PT.pdf"
+
+# (PDF bytes, ETag) as returned by PDFService.resume_pdf
+FAKE_PDF = (b"fake_pdf_content", content_etag(b"fake_pdf_content"))
+
+
+@pytest.fixture
+def project_mocks(mocker):
+    """GitHub and local project source mocks for the projects endpoints"""
+    return SimpleNamespace(
+        github_repos=mocker.patch('app.main.github_service.get_repositories'),
+        load_projects=mocker.patch('app.main.load_projects'),
+    )
+
+
+@pytest.fixture
+def contact_mocks(mocker):
+    """(save_contact, send_contact_email) mocks for contact form submissions"""
+    return (
+        mocker.patch('app.main.save_contact'),
+        mocker.patch('app.main.email_service.send_contact_email'),
+    )
 
 
 class TestMainEndpoints:
     """Test main application endpoints"""
 
-    def test_home_endpoint(self, client: TestClient):
-        """Test home page endpoint"""
-        response = client.get("/")
+    @pytest.mark.parametrize("path", ["/", "/about", "/contact", "/resume"])
+    def test_static_pages(self, client: TestClient, path):
+        """Test page endpoints render HTML"""
+        response = client.get(path)
         assert response.status_code == status.HTTP_200_OK
         assert "text/html" in response.headers["content-type"]
 
-    def test_about_endpoint(self, client: TestClient):
-        """Test about page endpoint"""
+    def test_static_page_etag(self, client: TestClient):
+        """Test that static pages are tagged and revalidated with ETags"""
         response = client.get("/about")
-        assert response.status_code == status.HTTP_200_OK
-        assert "text/html" in response.headers["content-type"]
+        etag = response.headers["etag"]
+        assert "max-age" in response.headers["cache-control"]
 
-    def test_contact_get_endpoint(self, client: TestClient):
-        """Test contact page GET endpoint"""
-        response = client.get("/contact")
-        assert response.status_code == status.HTTP_200_OK
-        assert "text/html" in response.headers["content-type"]
+        response = client.get("/about", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
 
-    def test_resume_endpoint(self, client: TestClient):
-        """Test resume page endpoint"""
-        response = client.get("/resume")
-        assert response.status_code == status.HTTP_200_OK
-        assert "text/html" in response.headers["content-type"]
-
-    @patch('app.main.github_service.get_repositories')
-    @patch('app.main.load_projects')
-    def test_projects_endpoint_no_search(self, mock_load_projects, mock_github_repos, client: TestClient):
+    def test_projects_endpoint_no_search(self, project_mocks, client: TestClient):
         """Test projects page without search"""
         # Mock data
-        mock_github_repos.return_value = [
+        project_mocks.github_repos.return_value = [
             {
                 "name": "github-repo",
                 "description": "A GitHub repository",
@@ -49,7 +68,7 @@ class TestMainEndpoints:
                 "source": "github"
             }
         ]
-        mock_load_projects.return_value = [
+        project_mocks.load_projects.return_value = [
             {
                 "name": "local-project",
                 "description": "A local project", 
@@ -59,22 +78,20 @@ class TestMainEndpoints:
 
         response = client.get("/projects")
         assert response.status_code == status.HTTP_200_OK
-        mock_github_repos.assert_called_once()
-        mock_load_projects.assert_called_once()
+        project_mocks.github_repos.assert_called_once()
+        project_mocks.load_projects.assert_called_once()
 
-    @patch('app.main.github_service.get_repositories')
-    @patch('app.main.load_projects')
-    def test_projects_endpoint_with_search(self, mock_load_projects, mock_github_repos, client: TestClient):
+    def test_projects_endpoint_with_search(self, project_mocks, client: TestClient):
         """Test projects page with search query"""
         # Mock data
-        mock_github_repos.return_value = [
+        project_mocks.github_repos.return_value = [
             {
                 "name": "python-api",
                 "description": "A Python API",
                 "source": "github"
             }
         ]
-        mock_load_projects.return_value = [
+        project_mocks.load_projects.return_value = [
             {
                 "name": "javascript-frontend",
                 "description": "A JavaScript frontend",
@@ -84,32 +101,42 @@ class TestMainEndpoints:
 
         response = client.get("/projects?search=python")
         assert response.status_code == status.HTTP_200_OK
-        mock_github_repos.assert_called_once()
-        mock_load_projects.assert_called_once()
+        project_mocks.github_repos.assert_called_once()
+        project_mocks.load_projects.assert_called_once()
 
-    @patch('app.main.github_service.get_repositories')
-    @patch('app.main.load_projects')
-    def test_htmx_projects_search(self, mock_load_projects, mock_github_repos, client: TestClient):
+    def test_htmx_projects_search(self, project_mocks, client: TestClient):
         """Test HTMX project search endpoint"""
         # Mock data
-        mock_github_repos.return_value = [
+        project_mocks.github_repos.return_value = [
             {
                 "name": "test-repo",
                 "description": "Test repository",
                 "source": "github"
             }
         ]
-        mock_load_projects.return_value = []
+        project_mocks.load_projects.return_value = []
 
         response = client.get("/htmx/projects/search?q=test")
         assert response.status_code == status.HTTP_200_OK
-        mock_github_repos.assert_called_once()
-        mock_load_projects.assert_called_once()
+        project_mocks.github_repos.assert_called_once()
+        project_mocks.load_projects.assert_called_once()
+
+    def test_htmx_projects_search_multiple_words(self, project_mocks, client: TestClient):
+        """Test that multi-word searches match projects containing every word"""
+        project_mocks.github_repos.return_value = [
+            {"name": "python-api", "description": "A FastAPI service", "source": "github"},
+            {"name": "python-cli", "description": "A command line tool", "source": "github"}
+        ]
+        project_mocks.load_projects.return_value = []
+
+        response = client.get("/htmx/projects/search?q=fastapi python")
+        assert response.status_code == status.HTTP_200_OK
+        assert "python-api" in response.text
+        assert "python-cli" not in response.text
 
-    @patch('app.main.email_service.send_contact_email')
-    @patch('app.main.save_contact')
-    def test_contact_submit_success(self, mock_save_contact, mock_send_email, client: TestClient, sample_contact_data):
+    def test_contact_submit_success(self, contact_mocks, client: TestClient, sample_contact_data):
         """Test successful contact form submission"""
+        mock_save_contact, mock_send_email = contact_mocks
         mock_send_email.return_value = True
 
         response = client.post("/contact", data=sample_contact_data)
@@ -126,10 +153,9 @@ class TestMainEndpoints:
             sample_contact_data["message"]
         )
 
-    @patch('app.main.email_service.send_contact_email')
-    @patch('app.main.save_contact')
-    def test_contact_submit_email_failure(self, mock_save_contact, mock_send_email, client: TestClient, sample_contact_data):
+    def test_contact_submit_email_failure(self, contact_mocks, client: TestClient, sample_contact_data):
         """Test contact form submission with email service failure"""
+        mock_save_contact, mock_send_email = contact_mocks
         mock_send_email.side_effect = Exception("Email service error")
 
         response = client.post("/contact", data=sample_contact_data)
@@ -143,37 +169,81 @@ class TestMainEndpoints:
         response = client.post("/contact", data={"name": "John"})  # Missing email and message
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-    @patch('app.main.pdf_service.generate_resume_pdf')
-    def test_download_resume_pdf_default_language(self, mock_generate_pdf, client: TestClient):
+    @patch('app.main.pdf_service.resume_pdf')
+    def test_download_resume_pdf_default_language(self, mock_resume_pdf, client: TestClient):
         """Test PDF resume download with default language (English)"""
-        mock_generate_pdf.return_value = b"fake_pdf_content"
+        mock_resume_pdf.return_value = FAKE_PDF
 
         response = client.get("/resume/download")
         assert response.status_code == status.HTTP_200_OK
         assert response.headers["content-type"] == "application/pdf"
-        assert "Leonardo_Murakami_Resume_EN.pdf" in response.headers["content-disposition"]
-        mock_generate_pdf.assert_called_once_with("en")
+        assert response.headers["content-disposition"] == EXPECTED_CD_EN
+        mock_resume_pdf.assert_called_once_with("en")
 
-    @patch('app.main.pdf_service.generate_resume_pdf')
-    def test_download_resume_pdf_portuguese(self, mock_generate_pdf, client: TestClient):
+    @patch('app.main.pdf_service.resume_pdf')
+    def test_download_resume_pdf_portuguese(self, mock_resume_pdf, client: TestClient):
         """Test PDF resume download in Portuguese"""
-        mock_generate_pdf.return_value = b"fake_pdf_content"
+        mock_resume_pdf.return_value = FAKE_PDF
 
         response = client.get("/resume/download?language=pt")
         assert response.status_code == status.HTTP_200_OK
-        assert "Leonardo_Murakami_Resume_PT.pdf" in response.headers["content-disposition"]
-        mock_generate_pdf.assert_called_once_with("pt")
+        assert response.headers["content-disposition"] == EXPECTED_CD_PT
+        mock_resume_pdf.assert_called_once_with("pt")
+
+    @patch('app.main.pdf_service.resume_pdf')
+    def test_download_resume_pdf_unsupported_language(self, mock_resume_pdf, client: TestClient):
+        """Test that unknown or path-like languages are served the English resume"""
+        mock_resume_pdf.return_value = FAKE_PDF
+
+        response = client.get("/resume/download?language=./en")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-disposition"] == EXPECTED_CD_EN
+        mock_resume_pdf.assert_called_once_with("en")
+
+    @patch('app.main.pdf_service.resume_pdf')
+    def test_download_resume_pdf_not_modified(self, mock_resume_pdf, client: TestClient):
+        """Test PDF resume download revalidation with If-None-Match"""
+        mock_resume_pdf.return_value = FAKE_PDF
+
+        etag = client.get("/resume/download").headers["etag"]
+        assert etag == FAKE_PDF[1]
+        response = client.get("/resume/download", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["etag"] == etag
+
+    @pytest.mark.parametrize("if_none_match,expected_status", [
+        ('"other", {etag}', status.HTTP_304_NOT_MODIFIED),
+        ("W/{etag}", status.HTTP_304_NOT_MODIFIED),
+        ("*", status.HTTP_304_NOT_MODIFIED),
+        ("{etag}-gzip", status.HTTP_200_OK),
+        ('"other"', status.HTTP_200_OK),
+    ])
+    @patch('app.main.pdf_service.resume_pdf')
+    def test_download_resume_pdf_if_none_match(
+        self, mock_resume_pdf, client: TestClient, if_none_match, expected_status
+    ):
+        """Test that If-None-Match lists are matched by whole tag, not by substring"""
+        mock_resume_pdf.return_value = FAKE_PDF
+        etag = FAKE_PDF[1]
+
+        response = client.get(
+            "/resume/download", headers={"If-None-Match": if_none_match.format(etag=etag)}
+        )
+        assert response.status_code == expected_status
 
-    @patch('app.main.pdf_service.generate_resume_pdf')
-    def test_download_resume_pdf_error(self, mock_generate_pdf, client: TestClient):
+    @patch('app.main.pdf_service.resume_pdf')
+    def test_download_resume_pdf_error(self, mock_resume_pdf, client: TestClient):
         """Test PDF resume download with generation error"""
-        mock_generate_pdf.side_effect = Exception("PDF generation failed")
+        mock_resume_pdf.side_effect = Exception("PDF generation failed")
 
         response = client.get("/resume/download")
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         assert "Error generating PDF" in response.json()["detail"]
 
-    def test_htmx_theme_toggle(self, client: TestClient):
-        """Test HTMX theme toggle endpoint"""
-        response = client.post("/htmx/theme/toggle", data={"theme": "dark"})
+    @pytest.mark.parametrize("current,toggled", [("light", "dark"), ("dark", "light")])
+    def test_htmx_theme_toggle(self, client: TestClient, current, toggled):
+        """Test HTMX theme toggle endpoint flips the theme cookie"""
+        response = client.post("/htmx/theme/toggle", cookies={"theme": current})
         assert response.status_code == status.HTTP_200_OK
+        assert f"theme={toggled}" in response.headers["set-cookie"]
+        assert toggled in response.text
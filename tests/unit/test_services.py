@@ -2,30 +2,86 @@
 Tests for application services
 """
 import pytest
-from unittest.mock import Mock, AsyncMock, patch, mock_open
+from unittest.mock import Mock, AsyncMock, patch
 import httpx
 import smtplib
-import json
+import orjson
 import io
+from concurrent.futures import ThreadPoolExecutor
 
 from app.services.github import GitHubService
 from app.services.email import EmailService
-from app.services.pdf import PDFService
+from app.services.pdf import LOCALE_FILES, PDFService, _font_config, _load_locale, content_etag
+from tests.fixtures.sample_data import SAMPLE_RESUME_EN, SAMPLE_RESUME_PT
+
+
+@pytest.fixture(scope="module")
+def github_service():
+    """GitHubService shared by tests that only call pure helpers (never mutate it)"""
+    return GitHubService()
+
+
+@pytest.fixture(scope="module")
+def pdf_service():
+    """PDFService shared by tests that don't render or touch its caches"""
+    return PDFService()
+
+
+@pytest.fixture(scope="session")
+def sample_locale_en_bytes(sample_locales):
+    """English sample locale serialized once, as `Path.read_bytes` would return it"""
+    return orjson.dumps(sample_locales["en"], default=dict)
+
+
+@pytest.fixture(scope="session")
+def transformed_en(sample_locales):
+    """English sample locale in PDF template format, transformed once"""
+    return PDFService()._transform_locale_data(sample_locales["en"], "en")
+
+
+@pytest.fixture(scope="session")
+def pdf_css():
+    """PDF stylesheet source, built once"""
+    return PDFService()._get_pdf_css()
+
+
+# REST API repositories shared by the get_repositories cases
+ORIGINAL_REPO = {
+    "name": "original-repo",
+    "description": "Original repository",
+    "html_url": "https://github.com/testuser/original-repo",
+    "homepage": "https://original-repo.com",
+    "fork": False,
+    "stargazers_count": 5,
+    "language": "Python",
+    "updated_at": "2023-01-01T00:00:00Z",
+    "topics": ["fastapi", "python"]
+}
+
+FORKED_REPO = {
+    "name": "forked-repo",
+    "description": "Forked repository",
+    "html_url": "https://github.com/testuser/forked-repo",
+    "fork": True,
+    "stargazers_count": 10,
+    "language": "Python",
+    "updated_at": "2023-01-01T00:00:00Z",
+    "topics": []
+}
 
 
 class TestGitHubService:
     """Test GitHub service functionality"""
 
-    def test_init_with_settings(self, mock_settings):
+    def test_init_with_settings(self, mock_settings, monkeypatch):
         """Test GitHub service initialization"""
-        with patch('app.services.github.settings', mock_settings):
-            service = GitHubService()
-            
-            assert service.base_url == "https://api.github.com"
-            assert service.username == mock_settings.github_username
-            assert service.token == mock_settings.github_token
-
-    @pytest.mark.asyncio
+        monkeypatch.setattr('app.services.github.settings', mock_settings)
+        service = GitHubService()
+        
+        assert service.base_url == "https://api.github.com"
+        assert service.username == mock_settings.github_username
+        assert service.token == mock_settings.github_token
+
     async def test_get_repositories_no_username(self):
         """Test get repositories when no username is configured"""
         service = GitHubService()
@@ -34,89 +90,121 @@ class TestGitHubService:
         result = await service.get_repositories()
         assert result == []
 
-    @pytest.mark.asyncio
-    async def test_get_repositories_success(self, mock_github_response):
-        """Test successful repository fetching"""
+    async def test_get_repositories_graphql_with_token(self, mock_httpx_client):
+        """Test that an authenticated service uses the GraphQL API"""
         service = GitHubService()
         service.username = "testuser"
         service.token = "test_token"
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_github_response
+        mock_response.json.return_value = {
+            "data": {"user": {"repositories": {"nodes": [
+                {
+                    "name": "test-repo",
+                    "description": "Test repository",
+                    "url": "https://github.com/testuser/test-repo",
+                    "homepageUrl": "",
+                    "primaryLanguage": {"name": "Python"},
+                    "stargazerCount": 5,
+                    "updatedAt": "2023-01-01T00:00:00Z",
+                    "repositoryTopics": {"nodes": [{"topic": {"name": "fastapi"}}]}
+                }
+            ]}}}
+        }
         mock_response.raise_for_status.return_value = None
 
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-            
-            result = await service.get_repositories()
-            
-            assert len(result) == 1
+        mock_httpx_client.post.return_value = mock_response
+        
+        result = await service.get_repositories(limit=5)
+        
+        assert len(result) == 1
+        repo = result[0]
+        assert repo["github_url"] == "https://github.com/testuser/test-repo"
+        assert repo["demo_url"] is None
+        assert repo["technologies"] == "Python, fastapi"
+        assert repo["stars"] == 5
+        variables = mock_httpx_client.post.call_args.kwargs["json"]["variables"]
+        assert variables == {"login": "testuser", "limit": 5}
+
+    @pytest.mark.parametrize("payload,error,expected_names", [
+        pytest.param([ORIGINAL_REPO], None, ["original-repo"], id="success"),
+        pytest.param([ORIGINAL_REPO, FORKED_REPO], None, ["original-repo"], id="filters-forks"),
+        pytest.param(None, httpx.HTTPError("API Error"), [], id="http-error"),
+    ])
+    async def test_get_repositories(self, mock_httpx_client, payload, error, expected_names):
+        """Test REST repository fetching: formatting, fork filtering and HTTP errors"""
+        service = GitHubService()
+        service.username = "testuser"
+        service.token = None
+
+        mock_response = Mock()
+        mock_response.json.return_value = payload
+        mock_response.raise_for_status.side_effect = error
+
+        mock_httpx_client.get.return_value = mock_response
+        
+        result = await service.get_repositories()
+        
+        assert [repo["name"] for repo in result] == expected_names
+        if result:
             repo = result[0]
-            assert repo["name"] == "test-repo"
-            assert repo["description"] == "Test repository"
+            assert repo["description"] == "Original repository"
+            assert repo["demo_url"] == "https://original-repo.com"
             assert repo["source"] == "github"
             assert repo["stars"] == 5
-            assert "fastapi, python" in repo["technologies"]
+            assert repo["technologies"] == "Python, fastapi, python"
 
-    @pytest.mark.asyncio
-    async def test_get_repositories_filters_forks(self):
-        """Test that forked repositories are filtered out"""
+    async def test_get_repositories_cached(self, mock_github_response, mock_httpx_client):
+        """Test that repeated calls within the TTL reuse the cached result"""
         service = GitHubService()
         service.username = "testuser"
 
-        mock_response_data = [
-            {
-                "name": "original-repo",
-                "description": "Original repository",
-                "html_url": "https://github.com/testuser/original-repo",
-                "fork": False,
-                "stargazers_count": 5,
-                "language": "Python",
-                "updated_at": "2023-01-01T00:00:00Z",
-                "topics": []
-            },
-            {
-                "name": "forked-repo",
-                "description": "Forked repository",
-                "html_url": "https://github.com/testuser/forked-repo", 
-                "fork": True,
-                "stargazers_count": 10,
-                "language": "Python",
-                "updated_at": "2023-01-01T00:00:00Z",
-                "topics": []
-            }
-        ]
-
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.json.return_value = mock_github_response
         mock_response.raise_for_status.return_value = None
 
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-            
-            result = await service.get_repositories()
-            
-            # Should only return non-forked repo
-            assert len(result) == 1
-            assert result[0]["name"] == "original-repo"
-
-    @pytest.mark.asyncio
-    async def test_get_repositories_http_error(self):
-        """Test repository fetching with HTTP error"""
+        mock_httpx_client.get.return_value = mock_response
+        
+        first = await service.get_repositories()
+        second = await service.get_repositories()
+        
+        assert first == second
+        assert mock_httpx_client.get.call_count == 1
+
+    async def test_get_repositories_error_not_cached(self, mock_github_response, mock_httpx_client):
+        """Test that failed fetches are not cached"""
         service = GitHubService()
         service.username = "testuser"
 
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = httpx.HTTPError("API Error")
 
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-            
-            result = await service.get_repositories()
-            assert result == []
+        mock_httpx_client.get.return_value = mock_response
+        
+        assert await service.get_repositories() == []
+        
+        mock_response.raise_for_status.side_effect = None
+        mock_response.json.return_value = mock_github_response
+        
+        result = await service.get_repositories()
+        assert len(result) == 1
+
+    async def test_get_random_repositories(self):
+        """Test random sampling from the cached repository listing"""
+        service = GitHubService()
+        repos = [{"name": f"repo-{i}"} for i in range(5)]
+        
+        service.get_repositories = AsyncMock(return_value=repos)
+        result = await service.get_random_repositories(count=3, limit=20)
+        
+        assert len(result) == 3
+        assert all(repo in repos for repo in result)
+        service.get_repositories.assert_called_once_with(limit=20)
+        
+        service.get_repositories.return_value = []
+        assert await service.get_random_repositories() == []
 
-    @pytest.mark.asyncio
-    async def test_get_repository_languages_success(self):
+    async def test_get_repository_languages_success(self, mock_httpx_client):
         """Test successful repository languages fetching"""
         service = GitHubService()
         service.username = "testuser"
@@ -128,16 +216,14 @@ class TestGitHubService:
         mock_response.json.return_value = languages_data
         mock_response.raise_for_status.return_value = None
 
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-            
-            result = await service.get_repository_languages("test-repo")
-            
-            assert result == languages_data
-            # Verify correct API endpoint was called
-            mock_client.return_value.__aenter__.return_value.get.assert_called_once()
+        mock_httpx_client.get.return_value = mock_response
+        
+        result = await service.get_repository_languages("test-repo")
+        
+        assert result == languages_data
+        # Verify correct API endpoint was called
+        assert mock_httpx_client.get.call_count == 1
 
-    @pytest.mark.asyncio 
     async def test_get_repository_languages_no_username(self):
         """Test repository languages fetching with no username"""
         service = GitHubService()
@@ -146,31 +232,27 @@ class TestGitHubService:
         result = await service.get_repository_languages("test-repo")
         assert result is None
 
-    def test_extract_technologies_with_language_and_topics(self):
+    def test_extract_technologies_with_language_and_topics(self, github_service):
         """Test technology extraction from repository data"""
-        service = GitHubService()
-        
         repo_data = {
             "language": "Python",
             "topics": ["fastapi", "web", "api"]
         }
         
-        result = service._extract_technologies(repo_data)
+        result = github_service._extract_technologies(repo_data)
         assert "Python" in result
         assert "fastapi" in result
         assert "web" in result
         assert "api" in result
 
-    def test_extract_technologies_no_language(self):
+    def test_extract_technologies_no_language(self, github_service):
         """Test technology extraction with no primary language"""
-        service = GitHubService()
-        
         repo_data = {
             "language": None,
             "topics": ["documentation", "markdown"]
         }
         
-        result = service._extract_technologies(repo_data)
+        result = github_service._extract_technologies(repo_data)
         assert "documentation" in result
         assert "markdown" in result
 
@@ -178,14 +260,22 @@ class TestGitHubService:
 class TestEmailService:
     """Test email service functionality"""
 
-    def test_init_with_settings(self, mock_settings):
+    @pytest.fixture
+    def smtp(self, monkeypatch):
+        """Patched smtplib.SMTP class and the server it returns"""
+        server = Mock()
+        smtp_class = Mock(return_value=server)
+        monkeypatch.setattr("smtplib.SMTP", smtp_class)
+        return smtp_class, server
+
+    def test_init_with_settings(self, mock_settings, monkeypatch):
         """Test email service initialization"""
-        with patch('app.services.email.settings', mock_settings):
-            service = EmailService()
-            
-            assert service.smtp_host == mock_settings.smtp_host
-            assert service.smtp_port == mock_settings.smtp_port
-            assert service.contact_email == mock_settings.contact_email
+        monkeypatch.setattr('app.services.email.settings', mock_settings)
+        service = EmailService()
+        
+        assert service.smtp_host == mock_settings.smtp_host
+        assert service.smtp_port == mock_settings.smtp_port
+        assert service.contact_email == mock_settings.contact_email
 
     def test_is_mailhog_detection(self):
         """Test MailHog detection"""
@@ -205,8 +295,7 @@ class TestEmailService:
         service.smtp_port = 587
         assert service._is_mailhog() is False
 
-    @patch('smtplib.SMTP')
-    def test_create_smtp_connection_regular(self, mock_smtp):
+    def test_create_smtp_connection_regular(self, smtp):
         """Test SMTP connection creation for regular SMTP servers"""
         service = EmailService()
         service.smtp_host = "smtp.gmail.com"
@@ -214,25 +303,22 @@ class TestEmailService:
         service.smtp_username = "user@gmail.com"
         service.smtp_password = "password"
         
-        mock_server = Mock()
-        mock_smtp.return_value = mock_server
+        mock_smtp, mock_server = smtp
         
         result = service._create_smtp_connection()
         
         mock_smtp.assert_called_once_with("smtp.gmail.com", 587)
-        mock_server.starttls.assert_called_once()
+        assert mock_server.starttls.call_count == 1
         mock_server.login.assert_called_once_with("user@gmail.com", "password")
         assert result == mock_server
 
-    @patch('smtplib.SMTP')
-    def test_create_smtp_connection_mailhog(self, mock_smtp):
+    def test_create_smtp_connection_mailhog(self, smtp):
         """Test SMTP connection creation for MailHog"""
         service = EmailService()
         service.smtp_host = "mailhog"
         service.smtp_port = 1025
         
-        mock_server = Mock()
-        mock_smtp.return_value = mock_server
+        mock_smtp, mock_server = smtp
         
         result = service._create_smtp_connection()
         
@@ -242,17 +328,14 @@ class TestEmailService:
         mock_server.login.assert_not_called()
         assert result == mock_server
 
-    @pytest.mark.asyncio
-    @patch('smtplib.SMTP')
-    async def test_send_contact_email_success(self, mock_smtp, sample_contact_data):
+    async def test_send_contact_email_success(self, smtp, sample_contact_data):
         """Test successful contact email sending"""
         service = EmailService()
         service.smtp_host = "mailhog"
         service.smtp_port = 1025
         service.contact_email = "contact@example.com"
         
-        mock_server = Mock()
-        mock_smtp.return_value = mock_server
+        _, mock_server = smtp
         
         result = await service.send_contact_email(
             sample_contact_data["name"],
@@ -261,10 +344,10 @@ class TestEmailService:
         )
         
         assert result is True
-        mock_server.sendmail.assert_called_once()
-        mock_server.quit.assert_called_once()
+        assert mock_server.sendmail.call_count == 1
+        # Connection is kept open for reuse
+        mock_server.quit.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_send_contact_email_no_config(self):
         """Test contact email sending with incomplete configuration"""
         service = EmailService()
@@ -274,18 +357,15 @@ class TestEmailService:
         result = await service.send_contact_email("John", "john@example.com", "Message")
         assert result is False
 
-    @pytest.mark.asyncio
-    @patch('smtplib.SMTP')
-    async def test_send_contact_email_smtp_error(self, mock_smtp, sample_contact_data):
+    async def test_send_contact_email_smtp_error(self, smtp, sample_contact_data):
         """Test contact email sending with SMTP error"""
         service = EmailService()
         service.smtp_host = "mailhog"
         service.smtp_port = 1025
         service.contact_email = "contact@example.com"
         
-        mock_server = Mock()
+        _, mock_server = smtp
         mock_server.sendmail.side_effect = smtplib.SMTPException("SMTP Error")
-        mock_smtp.return_value = mock_server
         
         result = await service.send_contact_email(
             sample_contact_data["name"],
@@ -294,47 +374,107 @@ class TestEmailService:
         )
         
         assert result is False
+        # The failed connection is closed, not just dropped
+        assert mock_server.close.call_count == 1
+        assert service._smtp is None
 
-    @pytest.mark.asyncio
-    @patch('smtplib.SMTP')
-    async def test_send_notification_email_success(self, mock_smtp):
+    async def test_send_notification_email_success(self, smtp):
         """Test successful notification email sending"""
         service = EmailService()
         service.smtp_host = "mailhog"
         service.smtp_port = 1025
         service.contact_email = "contact@example.com"
         
-        mock_server = Mock()
-        mock_smtp.return_value = mock_server
+        _, mock_server = smtp
         
         result = await service.send_notification_email("Test Subject", "Test Content")
         
         assert result is True
-        mock_server.sendmail.assert_called_once()
-        mock_server.quit.assert_called_once()
+        assert mock_server.sendmail.call_count == 1
+        # Connection is kept open for reuse
+        mock_server.quit.assert_not_called()
 
 
+    async def test_smtp_connection_reused(self, smtp):
+        """Test that consecutive emails share one SMTP connection"""
+        service = EmailService()
+        service.smtp_host = "mailhog"
+        service.smtp_port = 1025
+        service.contact_email = "contact@example.com"
+        
+        mock_smtp, mock_server = smtp
+        
+        assert await service.send_notification_email("First", "Content") is True
+        assert await service.send_notification_email("Second", "Content") is True
+        
+        assert mock_smtp.call_count == 1
+        assert mock_server.noop.call_count == 1
+        assert mock_server.sendmail.call_count == 2
+        
+        service.close()
+        assert mock_server.quit.call_count == 1
+
+    async def test_smtp_reconnects_after_drop(self, smtp):
+        """Test that a dropped SMTP connection is replaced"""
+        service = EmailService()
+        service.smtp_host = "mailhog"
+        service.smtp_port = 1025
+        service.contact_email = "contact@example.com"
+        
+        mock_smtp, stale_server = smtp
+        stale_server.noop.side_effect = smtplib.SMTPServerDisconnected()
+        fresh_server = Mock()
+        mock_smtp.side_effect = [stale_server, fresh_server]
+        
+        assert await service.send_notification_email("First", "Content") is True
+        assert await service.send_notification_email("Second", "Content") is True
+        
+        assert mock_smtp.call_count == 2
+        assert fresh_server.sendmail.call_count == 1
+
 class TestPDFService:
     """Test PDF service functionality"""
 
-    def test_init(self):
-        """Test PDF service initialization"""
-        service = PDFService()
-        assert service.templates_dir.name == "templates"
+    @pytest.fixture
+    def require_weasyprint(self):
+        """Skip render tests unless WeasyPrint and its native libraries load"""
+        # A missing cairo/pango surfaces as OSError, not ImportError
+        try:
+            import weasyprint  # noqa: F401
+        except (ImportError, OSError) as e:
+            pytest.skip(f"WeasyPrint unavailable: {e}")
+
+    @pytest.fixture(autouse=True)
+    def clear_locale_cache(self):
+        """Keep locale files read by one test from leaking into the next"""
+        _load_locale.cache_clear()
+        yield
+        _load_locale.cache_clear()
+
+    @pytest.mark.parametrize("kwargs,expected_dir", [
+        ({}, "templates"),
+        ({"templates_dir": "custom_templates"}, "custom_templates"),
+    ])
+    def test_init(self, kwargs, expected_dir):
+        """Test PDF service initialization with default and custom templates directories"""
+        service = PDFService(**kwargs)
+        assert service.templates_dir.name == expected_dir
         assert service.env is not None
 
-    def test_init_custom_templates_dir(self):
-        """Test PDF service initialization with custom templates directory"""
-        service = PDFService(templates_dir="custom_templates")
-        assert service.templates_dir.name == "custom_templates"
+    def test_environment_and_template_reused(self):
+        """Test that services share the Jinja2 environment and compile the template once"""
+        service = PDFService()
+        other = PDFService()
+        
+        assert service.env is other.env
+        assert service._resume_template is service._resume_template
 
-    @patch('builtins.open', new_callable=mock_open)
-    def test_get_resume_data_english(self, mock_open_func, sample_locales):
+    def test_get_resume_data_english(self, monkeypatch, sample_locales):
         """Test resume data loading for English"""
         service = PDFService()
         
-        # Mock file reading - the open call reads the JSON data
-        mock_open_func.return_value.__enter__.return_value.read.return_value = json.dumps(sample_locales["en"])
+        # Hand the parsed locale straight to the service: no file read, no JSON round-trip
+        monkeypatch.setattr("app.services.pdf._load_locale", lambda path: sample_locales["en"])
         
         result = service._get_resume_data("en")
         
@@ -343,52 +483,109 @@ class TestPDFService:
         assert "skills" in result
         assert "Programming Languages" in result["skills"]
 
-    @patch('builtins.open')
-    def test_get_resume_data_fallback_to_english(self, mock_open_func, sample_locales):
+    @patch('pathlib.Path.read_bytes')
+    def test_get_resume_data_memoized(self, mock_read_bytes, sample_locale_en_bytes):
+        """Test that each locale file is read and transformed only once"""
+        service = PDFService()
+        mock_read_bytes.return_value = sample_locale_en_bytes
+        
+        first = service._get_resume_data("en")
+        second = service._get_resume_data("en")
+        
+        assert second is first
+        mock_read_bytes.assert_called_once()
+
+    @patch('pathlib.Path.read_bytes')
+    def test_locale_file_shared_between_services(self, mock_read_bytes, sample_locale_en_bytes):
+        """Test that locale files are parsed once across PDFService instances"""
+        mock_read_bytes.return_value = sample_locale_en_bytes
+        
+        PDFService()._get_resume_data("en")
+        PDFService()._get_resume_data("en")
+        
+        mock_read_bytes.assert_called_once()
+
+    @patch('pathlib.Path.read_bytes', autospec=True)
+    def test_get_resume_data_fallback_to_english(self, mock_read_bytes, sample_locale_en_bytes):
         """Test resume data fallback to English when requested language fails"""
         service = PDFService()
         
         # First call (for requested language) fails, second call (fallback) succeeds  
-        def side_effect(*args, **kwargs):
-            if 'fr.json' in str(args[0]):
+        def side_effect(path):
+            if path.name == 'fr.json':
                 raise FileNotFoundError("File not found")
-            else:
-                # Return mock for en.json
-                mock_file = mock_open(read_data=json.dumps(sample_locales["en"]))()
-                return mock_file
+            # Return bytes for en.json
+            return sample_locale_en_bytes
         
-        mock_open_func.side_effect = side_effect
+        mock_read_bytes.side_effect = side_effect
         
         result = service._get_resume_data("fr")  # Request French, should fallback to English
         
         assert result["language"] == "en"
+        # Unsupported languages never reach the filesystem
+        assert [call.args[0].name for call in mock_read_bytes.call_args_list] == ["en.json"]
 
-    def test_transform_locale_data_english(self, sample_locales):
-        """Test locale data transformation for English"""
+    @patch('pathlib.Path.read_bytes', autospec=True)
+    def test_get_resume_data_malformed_falls_back(self, mock_read_bytes, sample_locale_en_bytes):
+        """Test that a malformed locale falls back to English, but English errors propagate"""
+        service = PDFService()
+        mock_read_bytes.side_effect = lambda path: (
+            b"{not json" if path.name == 'pt.json' else sample_locale_en_bytes
+        )
+        
+        assert service._get_resume_data("pt")["language"] == "en"
+        
+        mock_read_bytes.side_effect = lambda path: b"{not json"
+        _load_locale.cache_clear()
+        with pytest.raises(ValueError):
+            PDFService()._get_resume_data("en")
+
+    @patch('pathlib.Path.read_bytes', autospec=True)
+    def test_get_resume_data_incomplete_locale_falls_back(
+        self, mock_read_bytes, sample_locales, sample_locale_en_bytes
+    ):
+        """Test that a locale missing a required key falls back to English"""
+        incomplete = {key: value for key, value in sample_locales["en"].items() if key != "roles"}
+        mock_read_bytes.side_effect = lambda path: (
+            orjson.dumps(incomplete, default=dict) if path.name == 'pt.json' else sample_locale_en_bytes
+        )
+        
+        assert PDFService()._get_resume_data("pt")["language"] == "en"
+
+    def test_get_resume_data_from_locale_files(self, monkeypatch, sample_locale_files):
+        """Test that resume data is read from each language's locale file"""
+        en_file, pt_file = sample_locale_files
+        monkeypatch.setitem(LOCALE_FILES, "en", str(en_file))
+        monkeypatch.setitem(LOCALE_FILES, "pt", str(pt_file))
         service = PDFService()
         
-        result = service._transform_locale_data(sample_locales["en"], "en")
+        pt = service._get_resume_data("pt")
+        
+        assert pt["language"] == "pt"
+        assert pt["personal_info"]["title"] == SAMPLE_RESUME_PT["personal"]["title"]
+        assert "Linguagens de Programação" in pt["skills"]
+        assert service._get_resume_data("en")["summary"] == SAMPLE_RESUME_EN["summary"]
+
+    def test_transform_locale_data_english(self, pdf_service, sample_locales):
+        """Test locale data transformation for English"""
+        result = pdf_service._transform_locale_data(sample_locales["en"], "en")
         
         assert result["language"] == "en"
         assert result["personal_info"] == sample_locales["en"]["personal"]
         assert "Programming Languages" in result["skills"]
         assert "Python" in result["skills"]["Programming Languages"]
 
-    def test_transform_locale_data_portuguese(self, sample_locales):
+    def test_transform_locale_data_portuguese(self, pdf_service, sample_locales):
         """Test locale data transformation for Portuguese"""
-        service = PDFService()
-        
-        result = service._transform_locale_data(sample_locales["en"], "pt")  # Using EN data but PT language
+        result = pdf_service._transform_locale_data(sample_locales["en"], "pt")  # Using EN data but PT language
         
         assert result["language"] == "pt"
         assert "Linguagens de Programação" in result["skills"]
         assert "Python" in result["skills"]["Linguagens de Programação"]
 
-    def test_get_pdf_css(self):
+    def test_get_pdf_css(self, pdf_css):
         """Test PDF CSS generation"""
-        service = PDFService()
-        
-        css = service._get_pdf_css()
+        css = pdf_css
         
         assert "@page" in css
         assert "size: A4" in css
@@ -396,18 +593,16 @@ class TestPDFService:
         assert ".header" in css
         assert ".section" in css
 
-    @patch('weasyprint.HTML')
-    @patch('weasyprint.CSS')
-    @patch.object(PDFService, '_get_resume_data')
-    @patch.object(PDFService, '_get_pdf_css')
-    def test_generate_resume_pdf_success(self, mock_get_css, mock_get_data, mock_css, mock_html, sample_locales):
+    @pytest.mark.usefixtures("require_weasyprint")
+    @patch('weasyprint.HTML', new_callable=Mock)
+    @patch('weasyprint.CSS', new_callable=Mock)
+    def test_generate_resume_pdf_success(self, mock_css, mock_html, transformed_en, pdf_css):
         """Test successful PDF generation"""
         service = PDFService()
         
         # Mock data and CSS - _get_resume_data should return transformed data
-        transformed_data = service._transform_locale_data(sample_locales["en"], "en")
-        mock_get_data.return_value = transformed_data
-        mock_get_css.return_value = "body { font-family: Arial; }"
+        service._get_resume_data = Mock(return_value=transformed_en)
+        service._get_pdf_css = Mock(return_value=pdf_css)
         
         # Mock WeasyPrint objects
         mock_html_instance = Mock()
@@ -417,39 +612,138 @@ class TestPDFService:
         
         # Mock PDF bytes
         test_pdf_content = b"fake_pdf_content"
-        def write_pdf_side_effect(target, stylesheets=None):
-            target.write(test_pdf_content)
-            
-        mock_html_instance.write_pdf.side_effect = write_pdf_side_effect
+        mock_html_instance.write_pdf.return_value = test_pdf_content
         
         result = service.generate_resume_pdf("en")
         
         assert result == test_pdf_content
         mock_html.assert_called_once()
         mock_css.assert_called_once()
-        mock_html_instance.write_pdf.assert_called_once()
+        assert mock_css.call_args.kwargs["font_config"] is _font_config()
+        mock_html_instance.write_pdf.assert_called_once_with(
+            stylesheets=[mock_css_instance], font_config=_font_config()
+        )
+
+    @pytest.mark.usefixtures("require_weasyprint")
+    @patch('weasyprint.HTML', new_callable=Mock)
+    @patch('weasyprint.CSS', new_callable=Mock)
+    def test_generate_resume_pdf_cached(self, mock_css, mock_html, transformed_en):
+        """Test that repeat requests are served from the rendered PDF cache"""
+        service = PDFService()
+        service._get_resume_data = Mock(return_value=transformed_en)
+        
+        mock_html.return_value.write_pdf.return_value = b"fake_pdf_content"
+        
+        assert service.generate_resume_pdf("en") == b"fake_pdf_content"
+        assert service.generate_resume_pdf("en") == b"fake_pdf_content"
+        # Unknown languages resolve to English data and reuse its render
+        assert service.generate_resume_pdf("fr") == b"fake_pdf_content"
+        
+        mock_html.assert_called_once()
+        assert "fr" not in service._pdf_cache
+        # The ETag is computed with the render and served from the same cache entry
+        assert service.resume_pdf("fr") == (b"fake_pdf_content", content_etag(b"fake_pdf_content"))
+        assert service.resume_pdf("en") is service.resume_pdf("en")
+        
+        service.clear_cache()
+        service.generate_resume_pdf("en")
+        assert mock_html.call_count == 2
+
+    @pytest.mark.usefixtures("require_weasyprint")
+    def test_unsupported_language_not_cached(self, mock_weasyprint, transformed_en):
+        """Test that path-like language values share the English render and cache entry"""
+        service = PDFService()
+        service._get_resume_data = Mock(return_value=transformed_en)
+        
+        for language in ("en", "./en", ".//en", "././en", "../locales/en"):
+            assert service.resume_pdf(language)[0] == b"fake_pdf_content"
+        
+        mock_weasyprint["html"].assert_called_once()
+        assert list(service._pdf_cache) == ["en"]
+        service._get_resume_data.assert_called_once_with("en")
+
+    @pytest.mark.usefixtures("require_weasyprint")
+    @patch('weasyprint.HTML', new_callable=Mock)
+    @patch('weasyprint.CSS', new_callable=Mock)
+    def test_stylesheet_parsed_once(self, mock_css, mock_html, sample_locales):
+        """Test that the PDF stylesheet is parsed once across renders"""
+        service = PDFService()
+        service._get_resume_data = lambda language: service._transform_locale_data(
+            sample_locales["en"], language
+        )
+        mock_html.return_value.write_pdf.return_value = b"fake_pdf_content"
+        
+        service.generate_resume_pdf("en")
+        service.generate_resume_pdf("pt")
+        
+        assert mock_html.call_count == 2
+        mock_css.assert_called_once()
+
+    @pytest.mark.usefixtures("require_weasyprint")
+    @patch('app.services.pdf.ProcessPoolExecutor', lambda max_workers, mp_context: ThreadPoolExecutor(max_workers))
+    @patch('weasyprint.HTML', new_callable=Mock)
+    @patch('weasyprint.CSS', new_callable=Mock)
+    def test_warm_renders_every_language(self, mock_css, mock_html):
+        """Test that warming fills the cache so downloads skip rendering"""
+        mock_html.return_value.write_pdf.return_value = b"fake_pdf_content"
+        service = PDFService()
+        
+        service.warm()
+        
+        assert mock_html.call_count == 2
+        assert set(service._pdf_cache) == {"en", "pt"}
+        assert service.generate_resume_pdf("pt") == b"fake_pdf_content"
+        assert mock_html.call_count == 2
+
+    @patch('app.services.pdf.ProcessPoolExecutor', lambda max_workers, mp_context: ThreadPoolExecutor(max_workers))
+    @patch('app.services.pdf._render_resume')
+    def test_warm_keeps_languages_that_rendered(self, mock_render):
+        """Test that one failing language doesn't discard the others"""
+        mock_render.side_effect = lambda language: (
+            b"en_pdf" if language == "en" else (_ for _ in ()).throw(RuntimeError("render failed"))
+        )
+        service = PDFService()
+        
+        service.warm()
+        
+        assert service._pdf_cache == {"en": (b"en_pdf", content_etag(b"en_pdf"))}
+        assert service._warm_pool is None
+
+    @patch('app.services.pdf.ProcessPoolExecutor', lambda max_workers, mp_context: ThreadPoolExecutor(1))
+    @patch('app.services.pdf._render_resume')
+    def test_cancel_warm_drops_queued_renders(self, mock_render):
+        """Test that cancelling a warm-up skips renders that haven't started"""
+        service = PDFService()
+        
+        def render(language):
+            service.cancel_warm()
+            return f"{language}_pdf".encode()
+        
+        mock_render.side_effect = render
+        
+        service.warm()
+        
+        mock_render.assert_called_once_with("en")
+        assert list(service._pdf_cache) == ["en"]
 
-    @patch.object(PDFService, '_get_resume_data')
-    def test_generate_resume_pdf_data_error(self, mock_get_data):
+    def test_generate_resume_pdf_data_error(self):
         """Test PDF generation with data loading error"""
         service = PDFService()
-        mock_get_data.side_effect = Exception("Data loading failed")
+        service._get_resume_data = Mock(side_effect=Exception("Data loading failed"))
         
         with pytest.raises(Exception):
             service.generate_resume_pdf("en")
 
-    @patch('weasyprint.HTML')
-    @patch('weasyprint.CSS')  
-    @patch.object(PDFService, '_get_resume_data')
-    @patch.object(PDFService, '_get_pdf_css')
-    def test_generate_resume_pdf_weasyprint_error(self, mock_get_css, mock_get_data, mock_css, mock_html, sample_locales):
+    @pytest.mark.usefixtures("require_weasyprint")
+    @patch('weasyprint.HTML', new_callable=Mock)
+    @patch('weasyprint.CSS', new_callable=Mock)
+    def test_generate_resume_pdf_weasyprint_error(self, mock_css, mock_html, transformed_en, pdf_css):
         """Test PDF generation with WeasyPrint error"""
         service = PDFService()
         
         # Mock data and CSS - _get_resume_data should return transformed data
-        transformed_data = service._transform_locale_data(sample_locales["en"], "en")
-        mock_get_data.return_value = transformed_data
-        mock_get_css.return_value = "body { font-family: Arial; }"
+        service._get_resume_data = Mock(return_value=transformed_en)
+        service._get_pdf_css = Mock(return_value=pdf_css)
         
         # Mock WeasyPrint to raise error
         mock_html.side_effect = Exception("WeasyPrint error")